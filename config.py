@@ -22,14 +22,18 @@ SCOPES = [
 
 # Email Settings
 DEFAULT_BATCH_SIZE = 50
-DEFAULT_TIME_GAP = 5  # seconds between emails
+DEFAULT_TIME_GAP = 5  # seconds to pause between batches
 MAX_RETRIES = 3
+GMAIL_BATCH_LIMIT = 50  # max calls per Gmail batch request (Gmail rate-limits larger batches)
 MAX_ATTACHMENT_SIZE = 25 * 1024 * 1024  # 25MB Gmail limit
 
 # GUI Settings
 WINDOW_WIDTH = 1100
 WINDOW_HEIGHT = 800
 THEME = "equilux"  # Modern dark theme
+SHEETS_CACHE_TTL = 60  # seconds to reuse a spreadsheet's sheet list
+LOG_VIEW_MAX_LINES = 2000  # the log viewer keeps only the tail of the log file
+LOG_VIEW_MAX_BYTES = 512 * 1024  # never read more than this per refresh
 
 # Create necessary directories
 TEMPLATES_DIR.mkdir(exist_ok=True)
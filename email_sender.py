@@ -1,15 +1,21 @@
 import base64
 import time
+import datetime
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.base import MIMEBase
-from email.mime.application import MIMEApplication
-from email import encoders
 import os
 import mimetypes
 import re
+from html.parser import HTMLParser
+from google.auth.exceptions import GoogleAuthError
+from googleapiclient.errors import HttpError
+from httplib2 import HttpLib2Error
 from google_auth import GoogleAuthenticator
+from sheets_handler import SheetsHandler
 import config
 
 # Setup logging
@@ -19,6 +25,60 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+# HTTP statuses worth retrying inside a Gmail batch (rate limits and server errors)
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+# Failures of a Gmail call that are logged rather than raised: API errors, revoked or
+# expired tokens, and transport errors
+API_ERRORS = (HttpError, GoogleAuthError, HttpLib2Error, OSError)
+
+# Gmail also reports rate limits as 403 with one of these reasons
+RATE_LIMIT_REASONS = {'rateLimitExceeded', 'userRateLimitExceeded'}
+
+def is_retryable(error):
+    """Whether a Gmail HttpError is a rate limit or server error worth retrying"""
+    if error.resp.status in RETRYABLE_STATUS:
+        return True
+    details = getattr(error, 'error_details', None)
+    return (error.resp.status == 403 and isinstance(details, list)
+            and any(isinstance(detail, dict) and detail.get('reason') in RATE_LIMIT_REASONS for detail in details))
+
+# Attachments are base64-encoded in chunks of whole 76-character lines (57 raw bytes each)
+ATTACHMENT_READ_CHUNK = 57 * 1024
+
+# Whitespace around line breaks, collapsed when converting HTML to text
+LINE_BREAK_WS_RE = re.compile(r'\s*\n\s*')
+
+class HTMLTextExtractor(HTMLParser):
+    """Collect the text content of an HTML fragment in a single parsing pass"""
+    
+    BLOCK_TAGS = {'br', 'p', 'div', 'li', 'tr', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6'}
+    SKIP_TAGS = {'script', 'style'}
+    
+    def __init__(self):
+        super().__init__(convert_charrefs=True)  # entities are decoded by the parser
+        self.parts = []
+        self.skip_depth = 0
+    
+    def handle_starttag(self, tag, attrs):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+    
+    def handle_endtag(self, tag):
+        if tag in self.SKIP_TAGS:
+            self.skip_depth = max(0, self.skip_depth - 1)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+    
+    def handle_data(self, data):
+        if not self.skip_depth:
+            self.parts.append(data)
+    
+    def get_text(self):
+        return ''.join(self.parts)
+
 class EmailSender:
     def __init__(self):
         self.auth = GoogleAuthenticator()
@@ -26,9 +86,15 @@ class EmailSender:
         self.sender_email = None
         self.sent_count = 0
         self.failed_count = 0
+        self.stats_lock = threading.Lock()  # counters are updated from the batch worker
         self.max_attachment_size = 25 * 1024 * 1024  # 25MB Gmail limit
         self.gmail_aliases = []
+        self.gmail_alias_index = {}  # lowercased alias email -> alias
         self.gmail_signature = ""
+        # Separator + signature appended to text/HTML bodies ("" when there is no signature)
+        self.signature_text_suffix = ""
+        self.signature_html_suffix = ""
+        self._send_as_cache = None  # last sendAs list fetched from Gmail
     
     def connect(self):
         """Connect to Gmail API"""
@@ -37,8 +103,9 @@ class EmailSender:
             self.service = self.auth.get_gmail_service()
             self.sender_email = self.auth.get_user_email()
             
-            # Get Gmail aliases and signature
-            self.get_gmail_aliases()
+            # Get Gmail aliases and signature from a single sendAs fetch; both log their
+            # own errors, so a failing sendAs call doesn't fail the connection
+            self.get_gmail_aliases(refresh=True)
             self.get_gmail_signature()
             
             return True
@@ -46,15 +113,21 @@ class EmailSender:
             logging.error(f"Error connecting to Gmail: {e}")
             return False
     
-    def get_gmail_aliases(self):
+    def _fetch_send_as(self, refresh=False):
+        """Fetch the account's sendAs settings, reusing the last response unless refresh is set"""
+        if refresh or self._send_as_cache is None:
+            result = self.service.users().settings().sendAs().list(userId='me').execute()
+            self._send_as_cache = result.get('sendAs', [])
+        return self._send_as_cache
+    
+    def get_gmail_aliases(self, refresh=False):
         """Get available Gmail send-as aliases"""
         try:
             if not self.service:
                 return []
             
             # Get send-as aliases (verified email addresses that can be used as 'from')
-            result = self.service.users().settings().sendAs().list(userId='me').execute()
-            aliases = result.get('sendAs', [])
+            aliases = self._fetch_send_as(refresh)
             
             self.gmail_aliases = []
             for alias in aliases:
@@ -65,11 +138,12 @@ class EmailSender:
                         'signature': alias.get('signature', ''),
                         'is_primary': alias.get('isPrimary', False)
                     })
+            self.gmail_alias_index = {a['email'].lower(): a for a in self.gmail_aliases if a['email']}
             
             logging.info(f"Found {len(self.gmail_aliases)} verified send-as addresses")
             return self.gmail_aliases
             
-        except Exception as e:
+        except API_ERRORS as e:
             logging.error(f"Error getting Gmail aliases: {e}")
             return []
     
@@ -80,8 +154,7 @@ class EmailSender:
                 return ""
             
             # Get the primary send-as settings which includes signature
-            result = self.service.users().settings().sendAs().list(userId='me').execute()
-            send_as_list = result.get('sendAs', [])
+            send_as_list = self._fetch_send_as()
             
             for send_as in send_as_list:
                 if send_as.get('isPrimary'):
@@ -89,44 +162,41 @@ class EmailSender:
                     if signature_html:
                         # Convert HTML signature to plain text
                         signature_text = self.html_to_text(signature_html)
-                        self.gmail_signature = signature_text
+                        self.set_gmail_signature(signature_text)
                         logging.info("Gmail signature extracted successfully")
                         return signature_text
             
-            # If no primary signature, try to get from Gmail settings
-            try:
-                settings = self.service.users().settings().get(userId='me').execute()
-                if 'signature' in settings:
-                    signature_html = settings['signature']
-                    signature_text = self.html_to_text(signature_html)
-                    self.gmail_signature = signature_text
-                    return signature_text
-            except:
-                pass
-            
+            # Signatures only live on sendAs entries; there is no other settings resource to fall back on
             logging.info("No Gmail signature found")
             return ""
             
-        except Exception as e:
+        except API_ERRORS as e:
             logging.error(f"Error getting Gmail signature: {e}")
             return ""
     
+    def set_gmail_signature(self, signature_text):
+        """Store the plain-text signature and precompute the suffixes appended to bodies"""
+        self.gmail_signature = signature_text
+        if signature_text:
+            self.signature_text_suffix = f"\n\n--\n{signature_text}"
+            signature_html = signature_text.replace('\n', '<br>')
+            self.signature_html_suffix = f"<br><br>--<br>{signature_html}"
+        else:
+            self.signature_text_suffix = ""
+            self.signature_html_suffix = ""
+    
     def html_to_text(self, html):
         """Convert HTML to plain text"""
         if not html:
             return ""
         
-        # Remove HTML tags
-        text = re.sub('<.*?>', '', html)
-        # Replace HTML entities
-        text = text.replace('&nbsp;', ' ')
-        text = text.replace('&amp;', '&')
-        text = text.replace('&lt;', '<')
-        text = text.replace('&gt;', '>')
-        text = text.replace('&quot;', '"')
-        # Clean up whitespace
-        text = '\n'.join(line.strip() for line in text.split('\n') if line.strip())
-        return text
+        # Strip tags and decode entities in one pass
+        parser = HTMLTextExtractor()
+        parser.feed(html)
+        parser.close()
+        text = parser.get_text().replace('\xa0', ' ')
+        # Clean up whitespace: strip each line and drop blank ones
+        return LINE_BREAK_WS_RE.sub('\n', text).strip()
     
     def get_valid_from_email(self, requested_email, requested_name):
         """Get a valid from email that Gmail will accept"""
@@ -134,9 +204,9 @@ class EmailSender:
             return self.sender_email, requested_name or ""
         
         # Check if requested email is in verified aliases
-        for alias in self.gmail_aliases:
-            if alias['email'].lower() == requested_email.lower():
-                return requested_email, requested_name or alias['name']
+        alias = self.gmail_alias_index.get(requested_email.lower())
+        if alias:
+            return requested_email, requested_name or alias['name']
         
         # If not found in aliases, use primary email but keep the requested name
         logging.warning(f"Email {requested_email} not in verified aliases. Using primary email: {self.sender_email}")
@@ -157,32 +227,149 @@ class EmailSender:
                 return False, f"File is empty: {file_path}"
             
             return True, "Valid"
-        except Exception as e:
+        except OSError as e:
             return False, f"Error validating file: {str(e)}"
     
     def add_signature_to_body(self, body_text, include_signature=True):
         """Add Gmail signature to email body"""
-        if not include_signature or not self.gmail_signature:
+        if not include_signature or not self.signature_text_suffix:
             return body_text
         
         # Add signature with proper spacing
         if body_text.strip():
-            return f"{body_text}\n\n--\n{self.gmail_signature}"
+            return body_text + self.signature_text_suffix
         else:
             return f"{body_text}\n\n{self.gmail_signature}"
     
+    def _encode_file_base64(self, file_path):
+        """Base64-encode a file in fixed-size chunks, keeping only one raw chunk in memory"""
+        encoded = []
+        with open(file_path, "rb") as attachment_file:
+            while True:
+                chunk = attachment_file.read(ATTACHMENT_READ_CHUNK)
+                if not chunk:
+                    break
+                encoded.append(base64.encodebytes(chunk).decode('ascii'))
+        return ''.join(encoded)
+    
+    def _prepare_attachment_parts(self, attachments):
+        """Read, encode and wrap attachments as MIME parts that can be attached to many messages"""
+        parts = []
+        total_size = 0
+        for file_path in attachments:
+            try:
+                # Validate attachment
+                is_valid, error_msg = self.validate_attachment(file_path)
+                if not is_valid:
+                    logging.warning(f"Skipping invalid attachment: {error_msg}")
+                    continue
+                
+                file_size = os.path.getsize(file_path)
+                total_size += file_size
+                
+                # Check total attachment size
+                if total_size > self.max_attachment_size:
+                    logging.warning(f"Total attachment size exceeds 25MB limit, skipping: {file_path}")
+                    continue
+                
+                # Determine MIME type
+                mime_type, encoding = mimetypes.guess_type(file_path)
+                if mime_type is None:
+                    mime_type = 'application/octet-stream'
+                
+                main_type, sub_type = mime_type.split('/', 1)
+                
+                # Encode the file chunk by chunk rather than reading it whole
+                part = MIMEBase(main_type, sub_type)
+                part.set_payload(self._encode_file_base64(file_path))
+                part['Content-Transfer-Encoding'] = 'base64'
+                
+                # Add header with filename
+                filename = os.path.basename(file_path)
+                part.add_header(
+                    'Content-Disposition',
+                    f'attachment; filename="{filename}"'
+                )
+                
+                parts.append(part)
+                logging.info(f"Attached file: {filename} ({file_size} bytes)")
+                
+            except Exception as e:
+                logging.error(f"Error attaching file {file_path}: {e}")
+                continue
+        
+        return parts
+    
+    def _build_body_part(self, final_body_text, body_html=None, include_signature=True):
+        """Build the text (or text/html alternative) part of a multipart message"""
+        if not body_html:
+            # Add plain text only with signature
+            return MIMEText(final_body_text, 'plain', 'utf-8')
+        
+        msg_body = MIMEMultipart('alternative')
+        
+        # Add plain text part with signature
+        msg_body.attach(MIMEText(final_body_text, 'plain', 'utf-8'))
+        
+        # Add HTML part with signature
+        final_body_html = body_html
+        if include_signature:
+            final_body_html += self.signature_html_suffix
+        
+        msg_body.attach(MIMEText(final_body_html, 'html', 'utf-8'))
+        return msg_body
+    
+    def _build_template_message(self, sender, prepared_parts=None):
+        """Build the multipart skeleton shared by every message of a bulk send
+        
+        Returns (message, shared_parts); _fill_template_message only swaps the
+        To/Subject headers and the body part per recipient.
+        """
+        valid_from_email, valid_from_name = sender
+        message = MIMEMultipart()
+        message['to'] = ''
+        message['subject'] = ''
+        if valid_from_name:
+            message['from'] = f"{valid_from_name} <{valid_from_email}>"
+        else:
+            message['from'] = valid_from_email
+        return message, list(prepared_parts or [])
+    
+    def _fill_template_message(self, template, to_email, subject, body_text, body_html=None,
+                               include_signature=True):
+        """Personalize the shared skeleton for one recipient and encode it"""
+        message, shared_parts = template
+        message.replace_header('to', to_email)
+        message.replace_header('subject', subject)
+        
+        # Fresh body part each time: MIMEText payloads can't be re-encoded in place
+        final_body_text = self.add_signature_to_body(body_text, include_signature)
+        message.set_payload([self._build_body_part(final_body_text, body_html, include_signature)]
+                            + shared_parts)
+        
+        return {'raw': base64.urlsafe_b64encode(message.as_bytes()).decode()}
+    
     def create_message(self, to_email, subject, body_text, body_html=None, attachments=None, 
-                      from_email=None, from_name=None, include_signature=True):
-        """Create email message with enhanced attachment support and proper from address handling"""
+                      from_email=None, from_name=None, include_signature=True, prepared_parts=None,
+                      sender=None):
+        """Create email message with enhanced attachment support and proper from address handling
+        
+        prepared_parts: attachment parts from _prepare_attachment_parts, reused instead of
+        re-reading the files in `attachments`.
+        sender: (email, name) already resolved by get_valid_from_email, skipping the lookup.
+        """
         try:
             # Get valid from email
-            valid_from_email, valid_from_name = self.get_valid_from_email(from_email, from_name)
+            if sender:
+                valid_from_email, valid_from_name = sender
+            else:
+                valid_from_email, valid_from_name = self.get_valid_from_email(from_email, from_name)
             
             # Add signature to body
             final_body_text = self.add_signature_to_body(body_text, include_signature)
             
             # Determine message type based on content
-            if attachments or body_html:
+            if attachments or prepared_parts or body_html:
                 message = MIMEMultipart()
             else:
                 message = MIMEText(final_body_text, 'plain', 'utf-8')
@@ -207,80 +394,13 @@ class EmailSender:
                 message['from'] = valid_from_email
             
             # Create multipart message for text/html content
-            if body_html:
-                msg_body = MIMEMultipart('alternative')
-                
-                # Add plain text part with signature
-                part1 = MIMEText(final_body_text, 'plain', 'utf-8')
-                msg_body.attach(part1)
-                
-                # Add HTML part with signature
-                final_body_html = body_html
-                if include_signature and self.gmail_signature:
-                    # Convert signature to HTML for HTML emails
-                    signature_html = self.gmail_signature.replace('\n', '<br>')
-                    final_body_html = f"{body_html}<br><br>--<br>{signature_html}"
-                
-                part2 = MIMEText(final_body_html, 'html', 'utf-8')
-                msg_body.attach(part2)
-                
-                message.attach(msg_body)
-            else:
-                # Add plain text only with signature
-                text_part = MIMEText(final_body_text, 'plain', 'utf-8')
-                message.attach(text_part)
+            message.attach(self._build_body_part(final_body_text, body_html, include_signature))
             
             # Handle attachments
-            if attachments:
-                total_size = 0
-                for file_path in attachments:
-                    try:
-                        # Validate attachment
-                        is_valid, error_msg = self.validate_attachment(file_path)
-                        if not is_valid:
-                            logging.warning(f"Skipping invalid attachment: {error_msg}")
-                            continue
-                        
-                        file_size = os.path.getsize(file_path)
-                        total_size += file_size
-                        
-                        # Check total attachment size
-                        if total_size > self.max_attachment_size:
-                            logging.warning(f"Total attachment size exceeds 25MB limit, skipping: {file_path}")
-                            continue
-                        
-                        # Determine MIME type
-                        mime_type, encoding = mimetypes.guess_type(file_path)
-                        if mime_type is None:
-                            mime_type = 'application/octet-stream'
-                        
-                        main_type, sub_type = mime_type.split('/', 1)
-                        
-                        # Read and attach file
-                        with open(file_path, "rb") as attachment_file:
-                            if main_type == 'application':
-                                part = MIMEApplication(
-                                    attachment_file.read(),
-                                    _subtype=sub_type
-                                )
-                            else:
-                                part = MIMEBase(main_type, sub_type)
-                                part.set_payload(attachment_file.read())
-                                encoders.encode_base64(part)
-                        
-                        # Add header with filename
-                        filename = os.path.basename(file_path)
-                        part.add_header(
-                            'Content-Disposition',
-                            f'attachment; filename="{filename}"'
-                        )
-                        
-                        message.attach(part)
-                        logging.info(f"Attached file: {filename} ({file_size} bytes)")
-                        
-                    except Exception as e:
-                        logging.error(f"Error attaching file {file_path}: {e}")
-                        continue
+            if prepared_parts is None and attachments:
+                prepared_parts = self._prepare_attachment_parts(attachments)
+            for part in prepared_parts or []:
+                message.attach(part)
             
             # Encode message
             raw_message = base64.urlsafe_b64encode(message.as_bytes()).decode()
@@ -291,28 +411,113 @@ class EmailSender:
             return None
     
     def send_message(self, message):
-        """Send email message"""
-        try:
-            if not self.service:
-                if not self.connect():
-                    return False
-            
-            sent_message = self.service.users().messages().send(
-                userId="me", body=message
-            ).execute()
+        """Send email message, retrying rate-limited and server errors with backoff"""
+        if not self.service:
+            if not self.connect():
+                return False
+        
+        for attempt in range(config.MAX_RETRIES + 1):
+            try:
+                sent_message = self.service.users().messages().send(
+                    userId="me", body=message
+                ).execute()
+                
+                logging.info(f"Message sent. ID: {sent_message['id']}")
+                return True
+                
+            except HttpError as e:
+                if is_retryable(e) and attempt < config.MAX_RETRIES:
+                    delay = 2 ** (attempt + 1)
+                    logging.warning(f"Gmail returned {e.resp.status}, retrying in {delay} seconds")
+                    time.sleep(delay)
+                    continue
+                logging.error(f"Error sending message: {e}")
+                return False
+            except (GoogleAuthError, HttpLib2Error, OSError) as e:
+                logging.error(f"Error sending message: {e}")
+                return False
+    
+    def _record_result(self, sent, total_emails, progress_callback=None):
+        """Count a sent/failed email and report progress"""
+        with self.stats_lock:
+            if sent:
+                self.sent_count += 1
+            else:
+                self.failed_count += 1
+            sent_count, failed_count = self.sent_count, self.failed_count
+        
+        if progress_callback:
+            progress = ((sent_count + failed_count) / total_emails) * 100
+            progress_callback(progress, sent_count, failed_count)
+    
+    def _execute_batch(self, pending, total_emails, progress_callback=None, pause_after=0, stop_event=None):
+        """Send queued messages through one Gmail batch request, retrying rate-limited ones
+        
+        pause_after: seconds to wait once the batch is done, spacing out consecutive batches.
+        The pause ends early when stop_event is set.
+        """
+        attempt = 0
+        while pending:
+            retry = {}
+            handled = set()
+            
+            def on_sent(request_id, response, exception):
+                handled.add(request_id)
+                recipient = pending[request_id][0]
+                if exception is None:
+                    logging.info(f"Email sent to: {recipient} (ID: {response.get('id')})")
+                    self._record_result(True, total_emails, progress_callback)
+                elif (isinstance(exception, HttpError) and is_retryable(exception)
+                        and attempt < config.MAX_RETRIES):
+                    retry[request_id] = pending[request_id]
+                else:
+                    logging.error(f"Failed to send email to: {recipient} ({exception})")
+                    self._record_result(False, total_emails, progress_callback)
             
-            logging.info(f"Message sent. ID: {sent_message['id']}")
-            return True
+            batch = self.service.new_batch_http_request(callback=on_sent)
+            for request_id, (recipient, message) in pending.items():
+                batch.add(self.service.users().messages().send(userId='me', body=message),
+                          request_id=request_id)
             
-        except Exception as e:
-            logging.error(f"Error sending message: {e}")
-            return False
+            try:
+                batch.execute()
+            except Exception as e:
+                # Transport-level failure: nothing after this point reached the callback
+                logging.error(f"Error executing Gmail batch: {e}")
+                for request_id in pending.keys() - handled:
+                    if attempt < config.MAX_RETRIES:
+                        retry[request_id] = pending[request_id]
+                    else:
+                        logging.error(f"Failed to send email to: {pending[request_id][0]}")
+                        self._record_result(False, total_emails, progress_callback)
+            
+            pending = retry
+            if pending:
+                attempt += 1
+                delay = 2 ** attempt
+                logging.warning(f"Retrying {len(pending)} rate-limited message(s) in {delay} seconds")
+                time.sleep(delay)
+        
+        if pause_after:
+            logging.info(f"Completed batch. Pausing for {pause_after} seconds...")
+            if stop_event is not None:
+                stop_event.wait(pause_after)
+            else:
+                time.sleep(pause_after)
     
     def send_bulk_emails(self, sheet_data, template_subject, template_body, 
                         template_html=None, batch_size=None, time_gap=None, 
                         progress_callback=None, attachments=None, from_email=None, 
-                        from_name=None, include_signature=True):
-        """Send bulk emails with batch processing and time gaps"""
+                        from_name=None, include_signature=True, stop_event=None):
+        """Send bulk emails through Gmail batch requests with time gaps between batches
+        
+        Batches are sent from a worker thread so the next batch's messages are built
+        while the previous one is on the wire. Only one batch is in flight at a time
+        because the underlying Gmail HTTP client is not thread-safe.
+        
+        stop_event: optional threading.Event; once set, the batch in flight finishes
+        and the remaining rows are not sent.
+        """
         
         if not batch_size:
             batch_size = config.DEFAULT_BATCH_SIZE
@@ -329,6 +534,14 @@ class EmailSender:
         self.sent_count = 0
         self.failed_count = 0
         
+        if not self.service and not self.connect():
+            logging.error("Gmail service unavailable, aborting bulk send")
+            self.failed_count = total_emails
+            return self.sent_count, self.failed_count
+        
+        # Gmail accepts at most GMAIL_BATCH_LIMIT calls per batch request
+        chunk_size = min(batch_size, config.GMAIL_BATCH_LIMIT)
+        
         # Get valid from email
         valid_from_email, valid_from_name = self.get_valid_from_email(from_email, from_name)
         
@@ -339,74 +552,101 @@ class EmailSender:
         if include_signature and self.gmail_signature:
             logging.info("Including Gmail signature")
         
-        for i, row in enumerate(email_data):
-            try:
-                # Check if email column exists
-                email_col = None
-                for col in row.keys():
-                    if 'email' in col.lower() or 'mail' in col.lower():
-                        email_col = col
-                        break
-                
-                if not email_col:
-                    logging.error(f"No email column found in row {i}")
-                    self.failed_count += 1
-                    continue
-                
-                recipient_email = row[email_col]
-                if not recipient_email or '@' not in str(recipient_email):
-                    logging.error(f"Invalid email address: {recipient_email}")
-                    self.failed_count += 1
-                    continue
-                
-                # Replace placeholders in subject and body
-                from sheets_handler import SheetsHandler
-                sheets_handler = SheetsHandler()
-                
-                personalized_subject = sheets_handler.replace_placeholders(template_subject, row)
-                personalized_body = sheets_handler.replace_placeholders(template_body, row)
-                personalized_html = None
-                
-                if template_html:
-                    personalized_html = sheets_handler.replace_placeholders(template_html, row)
-                
-                # Create and send message
-                message = self.create_message(
-                    recipient_email, 
-                    personalized_subject, 
-                    personalized_body,
-                    personalized_html,
-                    attachments,
-                    valid_from_email,
-                    valid_from_name,
-                    include_signature
-                )
-                
-                if message and self.send_message(message):
-                    self.sent_count += 1
-                    logging.info(f"Email sent to: {recipient_email}")
-                else:
-                    self.failed_count += 1
-                    logging.error(f"Failed to send email to: {recipient_email}")
-                
-                # Update progress
-                if progress_callback:
-                    progress = ((self.sent_count + self.failed_count) / total_emails) * 100
-                    progress_callback(progress, self.sent_count, self.failed_count)
-                
-                # Add time gap between emails (except for last email)
-                if i < len(email_data) - 1:
-                    time.sleep(time_gap)
+        # Find the email column once; every row shares the sheet's headers
+        columns = email_data[0].keys() if email_data else []
+        email_col = next((col for col in columns if 'email' in col.lower() or 'mail' in col.lower()), None)
+        if not email_col:
+            logging.error("No email column found in sheet data")
+            self.failed_count = total_emails
+            return self.sent_count, self.failed_count
+        
+        # Compile templates once; each row then only fills in the placeholder fields
+        sheets_handler = SheetsHandler()
+        compiled_subject = sheets_handler.compile_template(template_subject, columns)
+        compiled_body = sheets_handler.compile_template(template_body, columns)
+        compiled_html = sheets_handler.compile_template(template_html, columns) if template_html else None
+        
+        # Encode attachments once and share the parts across every message
+        attachment_parts = self._prepare_attachment_parts(attachments) if attachments else None
+        
+        # Multipart sends share one skeleton (From + attachments); plain-text sends stay single-part
+        template_message = None
+        if attachments or compiled_html:
+            template_message = self._build_template_message((valid_from_email, valid_from_name),
+                                                            attachment_parts)
+        
+        def stopped():
+            return stop_event is not None and stop_event.is_set()
+        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix='gmail-batch') as executor:
+            in_flight = None
+            pending = {}
+            for i, row in enumerate(email_data):
+                if stopped():
+                    logging.info(f"Bulk email send stopped with {total_emails - i} row(s) left")
+                    pending = {}
+                    break
                 
-                # Batch processing - longer pause after each batch
-                if (self.sent_count + self.failed_count) % batch_size == 0:
-                    logging.info(f"Completed batch. Pausing for 10 seconds...")
-                    time.sleep(10)
+                try:
+                    recipient_email = row.get(email_col)
+                    if not recipient_email or '@' not in str(recipient_email):
+                        logging.error(f"Invalid email address: {recipient_email}")
+                        self._record_result(False, total_emails, progress_callback)
+                        continue
                     
-            except Exception as e:
-                logging.error(f"Error processing row {i}: {e}")
-                self.failed_count += 1
-        
+                    # Replace placeholders in subject and body
+                    personalized_subject = sheets_handler.render_template(compiled_subject, row)
+                    personalized_body = sheets_handler.render_template(compiled_body, row)
+                    personalized_html = None
+                    
+                    if compiled_html:
+                        personalized_html = sheets_handler.render_template(compiled_html, row)
+                    
+                    # Create message and queue it for the next batch
+                    if template_message:
+                        message = self._fill_template_message(
+                            template_message,
+                            recipient_email,
+                            personalized_subject,
+                            personalized_body,
+                            personalized_html,
+                            include_signature
+                        )
+                    else:
+                        message = self.create_message(
+                            recipient_email, 
+                            personalized_subject, 
+                            personalized_body,
+                            include_signature=include_signature,
+                            sender=(valid_from_email, valid_from_name)
+                        )
+                    
+                    if message:
+                        pending[str(i)] = (recipient_email, message)
+                    else:
+                        logging.error(f"Failed to create email for: {recipient_email}")
+                        self._record_result(False, total_emails, progress_callback)
+                        
+                except Exception as e:
+                    logging.error(f"Error processing row {i}: {e}")
+                    self._record_result(False, total_emails, progress_callback)
+                
+                # Hand a full batch to the worker (pausing afterwards) and keep building the next one
+                if len(pending) >= chunk_size:
+                    if in_flight:
+                        in_flight.result()
+                    if stopped():
+                        continue  # the loop drops the built batch on its next pass
+                    pause = time_gap if i < total_emails - 1 else 0
+                    in_flight = executor.submit(self._execute_batch, pending, total_emails,
+                                                progress_callback, pause, stop_event)
+                    pending = {}
+            
+            if in_flight:
+                in_flight.result()
+            if pending and not stopped():
+                self._execute_batch(pending, total_emails, progress_callback)
+            
         logging.info(f"Bulk email send completed. Sent: {self.sent_count}, Failed: {self.failed_count}")
         return self.sent_count, self.failed_count
     
@@ -428,9 +668,6 @@ class EmailSender:
                            attachments=None, from_email=None, from_name=None, include_signature=True):
         """Schedule an email to be sent at a specific datetime"""
         try:
-            import datetime
-            import threading
-            
             if isinstance(send_datetime, str):
                 send_datetime = datetime.datetime.fromisoformat(send_datetime)
             
@@ -1,11 +1,83 @@
 import os
 import json
-import pickle
+import threading
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
+from googleapiclient.discovery import build, build_from_document
+from googleapiclient.discovery_cache import get_static_doc
 import config
 
+# Credentials read from the token file, keyed by (path, mtime) so every authenticator
+# in the process shares a single read until the file changes
+_creds_cache = {}
+
+_auth_lock = threading.Lock()
+
+# Discovery documents bundled with googleapiclient, read once per process; each build still
+# parses its own copy because building a client fills in the parsed method descriptions
+_discovery_docs = {}  # (api, version) -> document text
+
+def load_credentials(token_file):
+    """Load saved credentials, reusing the cached copy while the file is unchanged"""
+    try:
+        mtime = os.path.getmtime(token_file)
+    except OSError:
+        return None
+    
+    key = (str(token_file), mtime)
+    if key not in _creds_cache:
+        try:
+            creds = Credentials.from_authorized_user_file(str(token_file), config.SCOPES)
+        except (UnicodeDecodeError, json.JSONDecodeError):
+            # Not JSON: tokens written by older versions were pickled; migrate them to JSON
+            creds = load_pickled_credentials(token_file)
+            if creds is None:
+                return None
+            save_credentials(creds, token_file)
+            key = (str(token_file), os.path.getmtime(token_file))
+        except ValueError:
+            # JSON, but not usable (e.g. no refresh_token after re-consent): run the OAuth flow again
+            return None
+        _creds_cache.clear()
+        _creds_cache[key] = creds
+    return _creds_cache[key]
+
+def load_pickled_credentials(token_file):
+    """Read a token pickled by an older version, or None if it can't be read"""
+    import pickle
+    try:
+        with open(token_file, 'rb') as token:
+            creds = pickle.load(token)
+    except Exception:
+        return None
+    return creds if isinstance(creds, Credentials) else None
+
+def save_credentials(creds, token_file):
+    """Write credentials to the token file as JSON and refresh the cache"""
+    # Write a sibling file and swap it in, so an interrupted save never leaves a truncated token
+    tmp_file = f"{token_file}.tmp"
+    with open(tmp_file, 'w') as token:
+        token.write(creds.to_json())
+    os.replace(tmp_file, token_file)
+    _creds_cache.clear()
+    _creds_cache[(str(token_file), os.path.getmtime(token_file))] = creds
+
+def build_service(api, version, creds):
+    """Build an API client for the given credentials
+    
+    Each authenticator keeps its own client: a client wraps one httplib2.Http, which is not
+    thread-safe, so clients are never shared between authenticators (and their threads).
+    """
+    doc = _discovery_docs.get((api, version))
+    if doc is None:
+        doc = get_static_doc(api, version)
+        if doc is None:
+            # Not bundled: let build report the unknown API
+            return build(api, version, credentials=creds, static_discovery=True, cache_discovery=False)
+        _discovery_docs[(api, version)] = doc
+    return build_from_document(doc, credentials=creds)
+
 class GoogleAuthenticator:
     def __init__(self):
         self.creds = None
@@ -14,52 +86,58 @@ class GoogleAuthenticator:
     
     def authenticate(self):
         """Authenticate with Google APIs"""
-        # Load existing token
-        if os.path.exists(config.TOKEN_FILE):
-            with open(config.TOKEN_FILE, 'rb') as token:
-                self.creds = pickle.load(token)
-        
-        # If there are no valid credentials available, request authorization
-        if not self.creds or not self.creds.valid:
-            if self.creds and self.creds.expired and self.creds.refresh_token:
-                self.creds.refresh(Request())
-            else:
-                if not os.path.exists(config.CREDENTIALS_FILE):
-                    raise FileNotFoundError(
-                        f"Credentials file not found at {config.CREDENTIALS_FILE}\n"
-                        "Please download it from Google Cloud Console"
-                    )
-                
-                flow = InstalledAppFlow.from_client_secrets_file(
-                    config.CREDENTIALS_FILE, config.SCOPES)
-                self.creds = flow.run_local_server(port=0)
+        # The GUI and the scheduler thread share the cached credentials and token file;
+        # one refresh or OAuth flow at a time, later callers pick up its result
+        with _auth_lock:
+            # Load existing token
+            self.creds = load_credentials(config.TOKEN_FILE)
             
-            # Save the credentials for the next run
-            with open(config.TOKEN_FILE, 'wb') as token:
-                pickle.dump(self.creds, token)
+            # If there are no valid credentials available, request authorization
+            if not self.creds or not self.creds.valid:
+                if self.creds and self.creds.expired and self.creds.refresh_token:
+                    self.creds.refresh(Request())
+                else:
+                    if not os.path.exists(config.CREDENTIALS_FILE):
+                        raise FileNotFoundError(
+                            f"Credentials file not found at {config.CREDENTIALS_FILE}\n"
+                            "Please download it from Google Cloud Console"
+                        )
+                    
+                    flow = InstalledAppFlow.from_client_secrets_file(
+                        config.CREDENTIALS_FILE, config.SCOPES)
+                    self.creds = flow.run_local_server(port=0)
+                
+                # Save the credentials for the next run
+                save_credentials(self.creds, config.TOKEN_FILE)
         
-        # Build services
-        self.service_gmail = build('gmail', 'v1', credentials=self.creds)
-        self.service_sheets = build('sheets', 'v4', credentials=self.creds)
+        # Services are built on first use, so each authenticator only builds the APIs it needs
+        self.service_gmail = None
+        self.service_sheets = None
         
         return True
     
     def get_gmail_service(self):
         """Get Gmail service instance"""
         if not self.service_gmail:
-            self.authenticate()
+            if not self.creds:
+                self.authenticate()
+            self.service_gmail = build_service('gmail', 'v1', self.creds)
         return self.service_gmail
     
     def get_sheets_service(self):
         """Get Sheets service instance"""
         if not self.service_sheets:
-            self.authenticate()
+            if not self.creds:
+                self.authenticate()
+            self.service_sheets = build_service('sheets', 'v4', self.creds)
         return self.service_sheets
     
     def get_user_email(self):
         """Get authenticated user's email address"""
+        if not self.creds:
+            return None
         try:
-            profile = self.service_gmail.users().getProfile(userId='me').execute()
+            profile = self.get_gmail_service().users().getProfile(userId='me').execute()
             return profile['emailAddress']
         except Exception as e:
             return None 
\ No newline at end of file
@@ -15,7 +15,12 @@ import sys
 import subprocess
 import os
 from pathlib import Path
-import pkg_resources
+
+try:
+    from importlib.metadata import distribution, PackageNotFoundError
+except ImportError:  # Python 3.7 has no importlib.metadata
+    from pkg_resources import get_distribution as distribution
+    from pkg_resources import DistributionNotFound as PackageNotFoundError
 
 def check_python_version():
     """Check if Python version is compatible"""
@@ -39,11 +44,13 @@ def install_dependencies():
         return False
     
     try:
-        # Upgrade pip first
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "--upgrade", "pip"])
+        # Upgrade pip first, on its own: --upgrade would also upgrade every unpinned requirement
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--disable-pip-version-check",
+                               "--upgrade", "pip"])
         
-        # Install requirements
-        subprocess.check_call([sys.executable, "-m", "pip", "install", "-r", str(requirements_file)])
+        # Install requirements, preferring wheels; pip was just upgraded, so skip its version lookup
+        subprocess.check_call([sys.executable, "-m", "pip", "install", "--prefer-binary",
+                               "--disable-pip-version-check", "-r", str(requirements_file)])
         print("✅ Dependencies installed successfully!")
         return True
     except subprocess.CalledProcessError as e:
@@ -113,9 +120,9 @@ def verify_installation():
     
     for package in required_packages:
         try:
-            pkg_resources.get_distribution(package)
+            distribution(package)
             print(f"✅ {package}")
-        except pkg_resources.DistributionNotFound:
+        except PackageNotFoundError:
             missing_packages.append(package)
             print(f"❌ {package} - NOT FOUND")
     
@@ -3,17 +3,93 @@ from tkinter import ttk, messagebox, filedialog, scrolledtext
 from tkinter.messagebox import askyesno, showinfo, showerror
 import threading
 import datetime
+import time
+import json
+import re
+import logging
+from collections import deque
+from operator import itemgetter
 from ttkthemes import ThemedTk
 import os
+import shutil
 import webbrowser
 
+try:
+    import orjson  # optional: faster template (de)serialization
+except ImportError:
+    orjson = None
+
 # Import our modules
 from google_auth import GoogleAuthenticator
-from sheets_handler import SheetsHandler
+from sheets_handler import SheetsHandler, PLACEHOLDER_PATTERN, SHEET_URL_PATTERN
 from email_sender import EmailSender
 from scheduler import EmailScheduler
 import config
 
+# File dialog filters
+ATTACHMENT_FILETYPES = (
+    ("All files", "*.*"),
+    ("Documents", "*.pdf *.doc *.docx *.txt *.rtf"),
+    ("Images", "*.jpg *.jpeg *.png *.gif *.bmp *.tiff"),
+    ("Spreadsheets", "*.xlsx *.xls *.csv"),
+    ("Presentations", "*.ppt *.pptx"),
+    ("Archives", "*.zip *.rar *.7z")
+)
+JSON_FILETYPES = (("JSON files", "*.json"), ("All files", "*.*"))
+TEXT_FILETYPES = (("Text files", "*.txt"), ("All files", "*.*"))
+
+# Scheduled job status -> marker shown in the jobs list
+JOB_STATUS_EMOJI = {
+    'active': '🟢',
+    'completed': '✅',
+    'cancelled': '❌',
+    'failed': '🔴'
+}
+
+# Schedule date and time as typed, "YYYY-MM-DD HH:MM"; like strptime, single-digit fields are accepted
+SCHEDULE_DATETIME_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2}) (\d{1,2}):(\d{1,2})', re.ASCII)
+
+def parse_schedule_datetime(schedule_date, schedule_time):
+    """Parse a schedule date and time, raising ValueError unless they form YYYY-MM-DD HH:MM"""
+    match = SCHEDULE_DATETIME_RE.fullmatch(f"{schedule_date} {schedule_time}")
+    if not match:
+        raise ValueError(f"Invalid schedule time: {schedule_date} {schedule_time}")
+    # datetime() itself rejects out-of-range fields such as month 13 or 25:00
+    return datetime.datetime(*map(int, match.groups()))
+
+_template_cache = {}  # template path -> (mtime, parsed template)
+
+def read_template(template_file):
+    """Read a template JSON file, reusing the parsed copy while the file is unchanged"""
+    template_file = str(template_file)
+    mtime = os.stat(template_file).st_mtime
+    cached = _template_cache.get(template_file)
+    if cached and cached[0] == mtime:
+        return cached[1]
+    
+    with open(template_file, 'rb') as f:
+        raw = f.read()
+    if orjson:
+        template_data = orjson.loads(raw)
+    else:
+        template_data = json.loads(raw)
+    _template_cache[template_file] = (mtime, template_data)
+    return template_data
+
+class LogViewerHandler(logging.Handler):
+    """Logging handler that flags new records for the log viewer
+    
+    emit runs on whichever thread logs, so it only sets an Event; the Tk thread polls it.
+    Calling into Tk from here could deadlock against the Tk thread logging at the same time.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.written = threading.Event()
+    
+    def emit(self, record):
+        self.written.set()
+
 class AutoMailerGUI:
     def __init__(self):
         # Initialize main window with modern theme
@@ -34,38 +110,56 @@ class AutoMailerGUI:
         # Variables
         self.authenticated = False
         self.current_sheet_data = None
+        self.preview_values = None  # row dict -> tuple of the previewed cells
+        self.preview_items = []  # recycled tree rows of the data preview
+        self.preview_offset = 0  # index of the first sheet row shown in the preview
+        self.pending_after = {}  # debounce key -> pending root.after id
         self.sending_in_progress = False
+        self.stop_event = threading.Event()  # set by stop_sending, checked by the send worker between emails
+        self.pending_progress = None  # latest (progress, sent, failed) not yet shown
+        self.progress_flush_scheduled = False
+        self.api_cache = {}  # (call, args) -> (expiry, result) for repeated Google API lookups
         self.attachment_files = []  # List to store attachment file paths
+        self.attachment_sizes = {}  # attachment path -> size in bytes, read once when added
+        self.attachments_total_size = 0
+        self.templates_listbox = None  # created with the templates tab
+        self.stats_label = None  # created with the settings tab
+        self.stats_values = None  # values last shown in stats_label
+        self.template_count = None  # cached for the stats panel, reset when templates change
+        self.templates_dir_mtime = None  # templates dir mtime at the last listbox refresh
+        self.log_handler = None  # installed with the logs tab
+        self.signature_popup = None  # popups are built on first use, then hidden and reused
+        self.placeholder_popup = None
+        self.toast = None  # notification window, built on first use
         
         # Create GUI
         self.create_widgets()
         self.center_window()
         
-        # Start scheduler
-        self.scheduler.start_scheduler()
+        # Start scheduler once the window has been drawn
+        self.root.after_idle(self.scheduler.start_scheduler)
     
     def setup_styles(self):
         """Setup custom styles for better appearance"""
-        style = ttk.Style()
-        
-        # Configure custom styles
-        style.configure('Title.TLabel', font=('Segoe UI', 12, 'bold'))
-        style.configure('Subtitle.TLabel', font=('Segoe UI', 10))
-        style.configure('Success.TLabel', foreground='#00ff00')
-        style.configure('Error.TLabel', foreground='#ff4444')
-        style.configure('Warning.TLabel', foreground='#ffaa00')
-        style.configure('Info.TLabel', foreground='#4488ff')
-        
-        # Button styles
-        style.configure('Action.TButton', font=('Segoe UI', 9, 'bold'))
-        style.configure('Success.TButton', font=('Segoe UI', 9, 'bold'))
-        style.configure('Danger.TButton', font=('Segoe UI', 9, 'bold'))
+        # Configure custom styles in one Tcl evaluation instead of a round-trip per style
+        self.root.tk.eval("""
+            ttk::style configure Title.TLabel -font {{Segoe UI} 12 bold}
+            ttk::style configure Subtitle.TLabel -font {{Segoe UI} 10}
+            ttk::style configure Success.TLabel -foreground #00ff00
+            ttk::style configure Error.TLabel -foreground #ff4444
+            ttk::style configure Warning.TLabel -foreground #ffaa00
+            ttk::style configure Info.TLabel -foreground #4488ff
+            
+            ttk::style configure Action.TButton -font {{Segoe UI} 9 bold}
+            ttk::style configure Success.TButton -font {{Segoe UI} 9 bold}
+            ttk::style configure Danger.TButton -font {{Segoe UI} 9 bold}
+        """)
     
     def center_window(self):
         """Center the window on screen"""
-        self.root.update_idletasks()
-        x = (self.root.winfo_screenwidth() // 2) - (self.root.winfo_width() // 2)
-        y = (self.root.winfo_screenheight() // 2) - (self.root.winfo_height() // 2)
+        # The window size is the configured one, so no layout pass is needed to measure it
+        x = (self.root.winfo_screenwidth() - config.WINDOW_WIDTH) // 2
+        y = (self.root.winfo_screenheight() - config.WINDOW_HEIGHT) // 2
         self.root.geometry(f"+{x}+{y}")
     
     def create_widgets(self):
@@ -81,12 +175,24 @@ class AutoMailerGUI:
         self.notebook = ttk.Notebook(main_container)
         self.notebook.pack(fill='both', expand=True, pady=(15, 0))
         
-        # Create tabs
+        # Create tabs; all but the main tab are built the first time they are shown
         self.create_main_tab()
-        self.create_templates_tab()
-        self.create_scheduler_tab()
-        self.create_settings_tab()
-        self.create_logs_tab()
+        self.tab_builders = {}  # tab frame path -> (builder, frame) for tabs not built yet
+        for text, builder in (("📝 Templates", self.create_templates_tab),
+                              ("⏰ Scheduler", self.create_scheduler_tab),
+                              ("⚙️ Settings", self.create_settings_tab),
+                              ("📋 Logs", self.create_logs_tab)):
+            tab_frame = ttk.Frame(self.notebook)
+            self.notebook.add(tab_frame, text=text)
+            self.tab_builders[str(tab_frame)] = (builder, tab_frame)
+        self.notebook.bind('<<NotebookTabChanged>>', self.on_tab_changed)
+    
+    def on_tab_changed(self, event):
+        """Build a tab's widgets the first time it is selected"""
+        pending = self.tab_builders.pop(self.notebook.select(), None)
+        if pending:
+            builder, tab_frame = pending
+            builder(tab_frame)
     
     def create_header(self, parent):
         """Create application header"""
@@ -117,9 +223,10 @@ class AutoMailerGUI:
         scrollbar = ttk.Scrollbar(main_frame, orient="vertical", command=canvas.yview)
         scrollable_frame = ttk.Frame(canvas)
         
+        # The frame is the canvas's only item, so its new size is the whole scroll region
         scrollable_frame.bind(
             "<Configure>",
-            lambda e: canvas.configure(scrollregion=canvas.bbox("all"))
+            lambda e: canvas.configure(scrollregion=(0, 0, e.width, e.height))
         )
         
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
@@ -135,8 +242,9 @@ class AutoMailerGUI:
         auth_btn_frame = ttk.Frame(auth_frame)
         auth_btn_frame.pack(fill='x', pady=(10, 0))
         
-        ttk.Button(auth_btn_frame, text="🔑 Authenticate with Google", 
-                  command=self.authenticate_google, style='Action.TButton').pack(side='left')
+        self.auth_btn = ttk.Button(auth_btn_frame, text="🔑 Authenticate with Google", 
+                                  command=self.authenticate_google, style='Action.TButton')
+        self.auth_btn.pack(side='left')
         
         self.signature_info_label = ttk.Label(auth_btn_frame, text="", style='Info.TLabel')
         self.signature_info_label.pack(side='right')
@@ -156,14 +264,16 @@ class AutoMailerGUI:
         sheets_controls = ttk.Frame(sheets_frame)
         sheets_controls.pack(fill='x')
         
-        ttk.Button(sheets_controls, text="🔄 Load Sheets", command=self.load_sheets).pack(side='left', padx=(0,10))
+        self.load_sheets_btn = ttk.Button(sheets_controls, text="🔄 Load Sheets", command=self.load_sheets)
+        self.load_sheets_btn.pack(side='left', padx=(0,10))
         
         ttk.Label(sheets_controls, text="Sheet:", style='Subtitle.TLabel').pack(side='left', padx=(0,5))
         self.sheet_name_var = tk.StringVar()
         self.sheet_combo = ttk.Combobox(sheets_controls, textvariable=self.sheet_name_var, width=25, font=('Segoe UI', 9))
         self.sheet_combo.pack(side='left', padx=(0,10))
         
-        ttk.Button(sheets_controls, text="👁️ Preview Data", command=self.preview_data).pack(side='left')
+        self.preview_data_btn = ttk.Button(sheets_controls, text="👁️ Preview Data", command=self.preview_data)
+        self.preview_data_btn.pack(side='left')
         
         # Data Preview with enhanced styling
         preview_frame = ttk.LabelFrame(scrollable_frame, text="📋 Data Preview", padding=15)
@@ -174,13 +284,16 @@ class AutoMailerGUI:
         tree_frame.pack(fill='both', expand=True)
         
         self.data_tree = ttk.Treeview(tree_frame, height=8)
-        data_scrollbar_y = ttk.Scrollbar(tree_frame, orient="vertical", command=self.data_tree.yview)
+        # Only the visible rows exist in the tree; vertical scrolling moves them over the sheet data
+        self.data_scrollbar_y = ttk.Scrollbar(tree_frame, orient="vertical", command=self.scroll_preview)
         data_scrollbar_x = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.data_tree.xview)
         
-        self.data_tree.configure(yscrollcommand=data_scrollbar_y.set, xscrollcommand=data_scrollbar_x.set)
+        self.data_tree.configure(xscrollcommand=data_scrollbar_x.set)
+        for sequence in ('<MouseWheel>', '<Button-4>', '<Button-5>'):
+            self.data_tree.bind(sequence, self.on_preview_wheel)
         
         self.data_tree.pack(side='left', fill='both', expand=True)
-        data_scrollbar_y.pack(side='right', fill='y')
+        self.data_scrollbar_y.pack(side='right', fill='y')
         data_scrollbar_x.pack(side='bottom', fill='x')
         
         # Email Template Section with enhanced design
@@ -200,7 +313,8 @@ class AutoMailerGUI:
         self.from_name_var = tk.StringVar()
         ttk.Entry(from_frame, textvariable=self.from_name_var, width=25, font=('Segoe UI', 9)).pack(side='left', padx=(5,15))
         
-        ttk.Button(from_frame, text="🔄 Refresh Aliases", command=self.refresh_aliases).pack(side='right')
+        self.refresh_aliases_btn = ttk.Button(from_frame, text="🔄 Refresh Aliases", command=self.refresh_aliases)
+        self.refresh_aliases_btn.pack(side='right')
         
         # Signature options
         signature_frame = ttk.Frame(template_frame)
@@ -223,6 +337,11 @@ class AutoMailerGUI:
         self.body_text = scrolledtext.ScrolledText(template_frame, height=10, wrap=tk.WORD, font=('Segoe UI', 9))
         self.body_text.pack(fill='x', pady=(5,10))
         
+        # Placeholders that match no sheet column are shown in red as you type
+        self.body_text.tag_configure('unknown_placeholder', foreground='#ff4444')
+        self.body_text.bind('<<Modified>>', self.on_body_modified)
+        self.body_cache = None  # body text as of the last get_body, reset on every edit
+        
         template_controls = ttk.Frame(template_frame)
         template_controls.pack(fill='x')
         
@@ -256,6 +375,7 @@ class AutoMailerGUI:
         
         # Attachment info label
         self.attachment_info_label = ttk.Label(attachments_frame, text="No attachments", style='Subtitle.TLabel')
+        self.attachment_info_style = 'Subtitle.TLabel'
         self.attachment_info_label.pack(anchor='w')
         
         # Sending Options with better layout
@@ -270,13 +390,13 @@ class AutoMailerGUI:
         batch_frame.pack(side='left', padx=(0,30))
         ttk.Label(batch_frame, text="Batch Size:", style='Subtitle.TLabel').pack()
         self.batch_size_var = tk.IntVar(value=config.DEFAULT_BATCH_SIZE)
-        batch_spin = ttk.Spinbox(batch_frame, from_=1, to=100, textvariable=self.batch_size_var, width=10)
+        batch_spin = ttk.Spinbox(batch_frame, from_=1, to=config.GMAIL_BATCH_LIMIT, textvariable=self.batch_size_var, width=10)
         batch_spin.pack()
         
         # Time gap
         gap_frame = ttk.Frame(options_grid)
         gap_frame.pack(side='left', padx=(0,30))
-        ttk.Label(gap_frame, text="Time Gap (sec):", style='Subtitle.TLabel').pack()
+        ttk.Label(gap_frame, text="Pause Between Batches (sec):", style='Subtitle.TLabel').pack()
         self.time_gap_var = tk.IntVar(value=config.DEFAULT_TIME_GAP)
         gap_spin = ttk.Spinbox(gap_frame, from_=1, to=60, textvariable=self.time_gap_var, width=10)
         gap_spin.pack()
@@ -314,8 +434,8 @@ class AutoMailerGUI:
         controls_frame.pack(fill='x', padx=10, pady=8)
         
         # Progress bar
-        self.progress_var = tk.DoubleVar()
-        self.progress_bar = ttk.Progressbar(controls_frame, variable=self.progress_var, maximum=100, length=400)
+        # Display-only, so the bar's value is set directly rather than through a traced variable
+        self.progress_bar = ttk.Progressbar(controls_frame, maximum=100, length=400)
         self.progress_bar.pack(fill='x', pady=(0,10))
         
         self.status_label = ttk.Label(controls_frame, text="Ready to send emails", style='Info.TLabel')
@@ -329,7 +449,8 @@ class AutoMailerGUI:
                                      command=self.send_emails, style='Success.TButton')
         self.send_button.pack(side='left', padx=(0,10))
         
-        ttk.Button(controls_buttons, text="🧪 Send Test Email", command=self.send_test_email).pack(side='left', padx=(0,10))
+        self.test_email_btn = ttk.Button(controls_buttons, text="🧪 Send Test Email", command=self.send_test_email)
+        self.test_email_btn.pack(side='left', padx=(0,10))
         ttk.Button(controls_buttons, text="⏹️ Stop Sending", command=self.stop_sending, style='Danger.TButton').pack(side='left')
         
         # Email count display
@@ -340,27 +461,78 @@ class AutoMailerGUI:
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
     
+    def run_in_background(self, work, on_done, error_message, api=False):
+        """Run blocking work on a worker thread and pass its result to on_done on the Tk thread
+        
+        With api=True every Google API button stays disabled until the work is done; bulk sends
+        do the same, so only one API job runs at a time (the authenticator's clients are not
+        thread-safe).
+        """
+        if api:
+            self.set_api_buttons_state(['disabled'])
+        
+        def finish(callback, *args):
+            if api:
+                self.set_api_buttons_state(['!disabled'])
+            callback(*args)
+        
+        def worker():
+            try:
+                result = work()
+            except Exception as e:
+                error = f"{error_message}: {str(e)}"
+                self.root.after(0, lambda: finish(showerror, "Error", error))
+            else:
+                self.root.after(0, lambda: finish(on_done, result))
+        
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def set_api_buttons_state(self, state):
+        """Apply a ttk state to every button that starts Google API work"""
+        for button in (self.auth_btn, self.load_sheets_btn, self.preview_data_btn, self.refresh_aliases_btn,
+                       self.send_button, self.test_email_btn):
+            button.state(state)
+    
+    def cached_call(self, key, ttl, producer):
+        """Return producer()'s result, reusing a non-empty result for ttl seconds"""
+        cached = self.api_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+        
+        result = producer()
+        if result:
+            self.api_cache[key] = (time.monotonic() + ttl, result)
+        return result
+    
     def paste_url(self):
         """Paste URL from clipboard"""
         try:
             clipboard_content = self.root.clipboard_get()
-            if 'docs.google.com/spreadsheets' in clipboard_content:
-                self.sheets_url_var.set(clipboard_content)
-                showinfo("Success", "URL pasted from clipboard!")
+            match = SHEET_URL_PATTERN.search(clipboard_content)
+            if match:
+                self.sheets_url_var.set(match.group(0))
+                self.show_toast("URL pasted from clipboard!")
             else:
                 showerror("Error", "Clipboard doesn't contain a valid Google Sheets URL")
-        except:
+        except tk.TclError:
             showerror("Error", "Could not access clipboard")
     
-    def refresh_aliases(self):
-        """Refresh Gmail aliases dropdown"""
+    def refresh_aliases(self, refresh=True):
+        """Refresh Gmail aliases dropdown (refetching them from Gmail unless refresh is False)"""
         if not self.authenticated:
             showerror("Error", "Please authenticate with Google first")
             return
         
+        if refresh:
+            self.run_in_background(lambda: self.email_sender.get_gmail_aliases(refresh=True),
+                                   lambda aliases: self.show_aliases(),
+                                   "Failed to refresh aliases", api=True)
+        else:
+            self.show_aliases()
+    
+    def show_aliases(self):
+        """Fill the From dropdown with the fetched Gmail aliases"""
         try:
-            # Force refresh aliases
-            self.email_sender.get_gmail_aliases()
             aliases = self.email_sender.gmail_aliases
             
             alias_emails = [alias['email'] for alias in aliases]
@@ -374,9 +546,9 @@ class AutoMailerGUI:
                         self.from_name_var.set(alias['name'])
                         break
                 
-                showinfo("Success", f"✅ Found {len(aliases)} verified send-as addresses")
+                self.show_toast(f"✅ Found {len(aliases)} verified send-as addresses")
             else:
-                showinfo("Info", "No additional send-as addresses found. Using primary email.")
+                self.show_toast("No additional send-as addresses found. Using primary email.")
                 
         except Exception as e:
             showerror("Error", f"Failed to refresh aliases: {str(e)}")
@@ -390,22 +562,25 @@ class AutoMailerGUI:
         signature = self.email_sender.gmail_signature
         if signature:
             # Create popup window for signature preview
-            preview_window = tk.Toplevel(self.root)
-            preview_window.title("Gmail Signature Preview")
-            preview_window.geometry("500x300")
-            preview_window.transient(self.root)
-            preview_window.grab_set()
-            
-            ttk.Label(preview_window, text="Your Gmail Signature:", style='Title.TLabel').pack(pady=10)
-            
-            signature_text = scrolledtext.ScrolledText(preview_window, height=12, wrap=tk.WORD, font=('Segoe UI', 9))
-            signature_text.pack(fill='both', expand=True, padx=15, pady=(0,15))
-            signature_text.insert(1.0, signature)
-            signature_text.config(state='disabled')
+            if self.signature_popup is None:
+                preview_window = self.create_popup("Gmail Signature Preview", "500x300")
+                
+                ttk.Label(preview_window, text="Your Gmail Signature:", style='Title.TLabel').pack(pady=10)
+                
+                self.signature_text = scrolledtext.ScrolledText(preview_window, height=12, wrap=tk.WORD, font=('Segoe UI', 9))
+                self.signature_text.pack(fill='both', expand=True, padx=15, pady=(0,15))
+                
+                ttk.Button(preview_window, text="Close",
+                          command=lambda: self.hide_popup(preview_window)).pack(pady=(0,15))
+                self.signature_popup = preview_window
             
-            ttk.Button(preview_window, text="Close", command=preview_window.destroy).pack(pady=(0,15))
+            self.signature_text.config(state='normal')
+            self.signature_text.delete(1.0, tk.END)
+            self.signature_text.insert(1.0, signature)
+            self.signature_text.config(state='disabled')
+            self.show_popup(self.signature_popup)
         else:
-            showinfo("Info", "No Gmail signature found for your account.")
+            self.show_toast("No Gmail signature found for your account.")
     
     def insert_placeholder(self):
         """Insert placeholder helper"""
@@ -414,39 +589,79 @@ class AutoMailerGUI:
             return
         
         # Create popup for placeholder selection
-        placeholder_window = tk.Toplevel(self.root)
-        placeholder_window.title("Insert Placeholder")
-        placeholder_window.geometry("400x300")
-        placeholder_window.transient(self.root)
-        placeholder_window.grab_set()
-        
-        ttk.Label(placeholder_window, text="Select a column to insert:", style='Title.TLabel').pack(pady=10)
-        
-        # List of available columns
-        columns_listbox = tk.Listbox(placeholder_window, font=('Segoe UI', 10))
-        columns_listbox.pack(fill='both', expand=True, padx=15, pady=(0,15))
-        
-        for header in self.current_sheet_data['headers']:
-            columns_listbox.insert(tk.END, header)
-        
-        def insert_selected():
-            selection = columns_listbox.curselection()
-            if selection:
-                column_name = columns_listbox.get(selection[0])
-                placeholder = f"(({column_name}))"
-                
-                # Insert at cursor position in body text
-                cursor_pos = self.body_text.index(tk.INSERT)
-                self.body_text.insert(cursor_pos, placeholder)
-                
-                placeholder_window.destroy()
-                showinfo("Success", f"✅ Inserted placeholder: {placeholder}")
-        
-        button_frame = ttk.Frame(placeholder_window)
-        button_frame.pack(pady=15)
-        
-        ttk.Button(button_frame, text="Insert", command=insert_selected).pack(side='left', padx=(0,10))
-        ttk.Button(button_frame, text="Cancel", command=placeholder_window.destroy).pack(side='left')
+        if self.placeholder_popup is None:
+            placeholder_window = self.create_popup("Insert Placeholder", "400x300")
+            
+            ttk.Label(placeholder_window, text="Select a column to insert:", style='Title.TLabel').pack(pady=10)
+            
+            # List of available columns
+            columns_listbox = tk.Listbox(placeholder_window, font=('Segoe UI', 10))
+            columns_listbox.pack(fill='both', expand=True, padx=15, pady=(0,15))
+            
+            def insert_selected():
+                selection = columns_listbox.curselection()
+                if selection:
+                    column_name = columns_listbox.get(selection[0])
+                    placeholder = f"(({column_name}))"
+                    
+                    # Insert at cursor position in body text
+                    cursor_pos = self.body_text.index(tk.INSERT)
+                    self.body_text.insert(cursor_pos, placeholder)
+                    
+                    self.hide_popup(placeholder_window)
+                    self.show_toast(f"✅ Inserted placeholder: {placeholder}")
+            
+            button_frame = ttk.Frame(placeholder_window)
+            button_frame.pack(pady=15)
+            
+            ttk.Button(button_frame, text="Insert", command=insert_selected).pack(side='left', padx=(0,10))
+            ttk.Button(button_frame, text="Cancel",
+                      command=lambda: self.hide_popup(placeholder_window)).pack(side='left')
+            self.placeholder_popup = placeholder_window
+            self.placeholder_listbox = columns_listbox
+        
+        self.placeholder_listbox.delete(0, tk.END)
+        self.placeholder_listbox.insert(tk.END, *self.current_sheet_data['headers'])
+        self.show_popup(self.placeholder_popup)
+    
+    def create_popup(self, title, geometry):
+        """Create a popup window that hides instead of closing so it can be reused"""
+        window = tk.Toplevel(self.root)
+        window.title(title)
+        window.geometry(geometry)
+        window.transient(self.root)
+        window.protocol("WM_DELETE_WINDOW", lambda: self.hide_popup(window))
+        return window
+    
+    def show_popup(self, window):
+        """Show a reusable popup as a modal window"""
+        window.deiconify()
+        window.lift()
+        window.grab_set()
+    
+    def hide_popup(self, window):
+        """Hide a reusable popup and release its grab"""
+        window.grab_release()
+        window.withdraw()
+    
+    def show_toast(self, message, duration=3000):
+        """Show a notification in the corner of the main window that hides itself"""
+        if self.toast is None:
+            self.toast = tk.Toplevel(self.root)
+            self.toast.overrideredirect(True)
+            self.toast.transient(self.root)
+            self.toast_label = ttk.Label(self.toast, style='Success.TLabel', padding=(14, 10))
+            self.toast_label.pack()
+        
+        self.toast_label.config(text=message)
+        self.toast.update_idletasks()
+        x = self.root.winfo_rootx() + self.root.winfo_width() - self.toast.winfo_reqwidth() - 20
+        y = self.root.winfo_rooty() + self.root.winfo_height() - self.toast.winfo_reqheight() - 20
+        self.toast.geometry(f"+{x}+{y}")
+        self.toast.deiconify()
+        self.toast.lift()
+        # A newer toast restarts the timer instead of being hidden by the older one
+        self.debounce('toast', duration, self.toast.withdraw)
     
     def use_auth_email(self):
         """Use the authenticated email as from email"""
@@ -475,69 +690,88 @@ class AutoMailerGUI:
         """Add attachment files"""
         file_paths = filedialog.askopenfilenames(
             title="Select Files to Attach",
-            filetypes=[
-                ("All files", "*.*"),
-                ("Documents", "*.pdf *.doc *.docx *.txt *.rtf"),
-                ("Images", "*.jpg *.jpeg *.png *.gif *.bmp *.tiff"),
-                ("Spreadsheets", "*.xlsx *.xls *.csv"),
-                ("Presentations", "*.ppt *.pptx"),
-                ("Archives", "*.zip *.rar *.7z")
-            ]
+            filetypes=ATTACHMENT_FILETYPES
         )
         
         if file_paths:
-            total_size = sum(os.path.getsize(f) for f in self.attachment_files if os.path.exists(f))
             max_size = 25 * 1024 * 1024  # 25MB
             
-            added_count = 0
+            new_labels = []
             for file_path in file_paths:
-                if file_path not in self.attachment_files:
-                    if os.path.exists(file_path):
-                        file_size = os.path.getsize(file_path)
-                        if total_size + file_size > max_size:
+                if file_path not in self.attachment_sizes:
+                    file_size = self.get_file_size(file_path)
+                    if file_size is not None:
+                        if self.attachments_total_size + file_size > max_size:
                             showerror("File Too Large", 
                                     f"Adding this file would exceed the 25MB attachment limit.\n"
                                     f"File: {os.path.basename(file_path)} ({file_size/(1024*1024):.1f}MB)")
                             continue
                         
-                        self.attachment_files.append(file_path)
-                        total_size += file_size
-                        self.attachments_listbox.insert(tk.END, f"📎 {os.path.basename(file_path)}")
-                        added_count += 1
+                        new_labels.append(self.append_attachment(file_path, file_size))
             
+            # Show all new files with one Listbox call
+            if new_labels:
+                self.attachments_listbox.insert(tk.END, *new_labels)
             self.update_attachment_info()
-            if added_count > 0:
-                showinfo("Success", f"✅ Added {added_count} attachment(s)")
+            if new_labels:
+                self.show_toast(f"✅ Added {len(new_labels)} attachment(s)")
     
     def remove_attachment(self):
         """Remove selected attachment"""
         selection = self.attachments_listbox.curselection()
         if selection:
             index = selection[0]
-            self.attachments_listbox.delete(index)
             if 0 <= index < len(self.attachment_files):
-                removed_file = self.attachment_files.pop(index)
-                showinfo("Success", f"✅ Removed {os.path.basename(removed_file)}")
+                removed_file = self.pop_attachment(index)
+                self.show_toast(f"✅ Removed {os.path.basename(removed_file)}")
             self.update_attachment_info()
         else:
             showerror("Error", "Please select an attachment to remove")
     
+    def get_file_size(self, file_path):
+        """Return a file's size from a single stat call, or None if it can't be read"""
+        try:
+            return os.stat(file_path).st_size
+        except OSError:
+            return None
+    
+    def append_attachment(self, file_path, file_size):
+        """Track an attachment with its size and return its label for the attachments list"""
+        self.attachment_files.append(file_path)
+        self.attachment_sizes[file_path] = file_size
+        self.attachments_total_size += file_size
+        return f"📎 {os.path.basename(file_path)}"
+    
+    def pop_attachment(self, index):
+        """Stop tracking the attachment at index and return its path"""
+        file_path = self.attachment_files.pop(index)
+        self.attachments_total_size -= self.attachment_sizes.pop(file_path, 0)
+        self.attachments_listbox.delete(index)
+        return file_path
+    
+    def reset_attachments(self):
+        """Stop tracking every attachment"""
+        self.attachment_files.clear()
+        self.attachment_sizes.clear()
+        self.attachments_total_size = 0
+        self.attachments_listbox.delete(0, tk.END)
+    
     def clear_attachments(self):
         """Clear all attachments"""
         if self.attachment_files:
             if askyesno("Confirm", "⚠️ Are you sure you want to remove all attachments?\n\n"
                                    "This action cannot be undone."):
-                self.attachment_files.clear()
-                self.attachments_listbox.delete(0, tk.END)
+                self.reset_attachments()
                 self.update_attachment_info()
-                showinfo("Success", "✅ All attachments removed")
+                self.show_toast("✅ All attachments removed")
     
     def update_attachment_info(self):
         """Update attachment information label"""
+        self.update_stats()
         if not self.attachment_files:
             self.attachment_info_label.config(text="📎 No attachments")
         else:
-            total_size = sum(os.path.getsize(f) for f in self.attachment_files if os.path.exists(f))
+            total_size = self.attachments_total_size
             size_mb = total_size / (1024 * 1024)
             count = len(self.attachment_files)
             
@@ -547,15 +781,19 @@ class AutoMailerGUI:
                 size_str = f"{size_mb:.1f} MB"
             
             if size_mb > 20:
-                self.attachment_info_label.config(text=f"⚠️ {count} file(s), {size_str} total (Near limit!)", style='Warning.TLabel')
+                text, style = f"⚠️ {count} file(s), {size_str} total (Near limit!)", 'Warning.TLabel'
             else:
-                self.attachment_info_label.config(text=f"📎 {count} file(s), {size_str} total", style='Info.TLabel')
+                text, style = f"📎 {count} file(s), {size_str} total", 'Info.TLabel'
+            
+            # Restyle only when crossing the warning threshold; usually just the text changes
+            if style != self.attachment_info_style:
+                self.attachment_info_style = style
+                self.attachment_info_label.config(text=text, style=style)
+            else:
+                self.attachment_info_label.config(text=text)
     
-    def create_templates_tab(self):
+    def create_templates_tab(self, templates_frame):
         """Create templates management tab"""
-        templates_frame = ttk.Frame(self.notebook)
-        self.notebook.add(templates_frame, text="📝 Templates")
-        
         # Header
         header_frame = ttk.Frame(templates_frame)
         header_frame.pack(fill='x', padx=15, pady=15)
@@ -587,11 +825,8 @@ class AutoMailerGUI:
         
         self.refresh_templates()
     
-    def create_scheduler_tab(self):
+    def create_scheduler_tab(self, scheduler_frame):
         """Create scheduler tab"""
-        scheduler_frame = ttk.Frame(self.notebook)
-        self.notebook.add(scheduler_frame, text="⏰ Scheduler")
-        
         # Header
         header_frame = ttk.Frame(scheduler_frame)
         header_frame.pack(fill='x', padx=15, pady=15)
@@ -619,13 +854,13 @@ class AutoMailerGUI:
         
         # Schedule time
         ttk.Label(schedule_frame, text="Time:", style='Subtitle.TLabel').pack(side='left', padx=(30,5))
-        self.schedule_time_var = tk.StringVar(value="09:00")
-        ttk.Entry(schedule_frame, textvariable=self.schedule_time_var, width=10).pack(side='left')
+        self.job_time_var = tk.StringVar(value="09:00")
+        ttk.Entry(schedule_frame, textvariable=self.job_time_var, width=10).pack(side='left')
         
         # Schedule date (for 'once' type)
         ttk.Label(schedule_frame, text="Date (YYYY-MM-DD):", style='Subtitle.TLabel').pack(side='left', padx=(30,5))
-        self.schedule_date_var = tk.StringVar(value=datetime.date.today().strftime("%Y-%m-%d"))
-        ttk.Entry(schedule_frame, textvariable=self.schedule_date_var, width=12).pack(side='left')
+        self.job_date_var = tk.StringVar(value=datetime.date.today().strftime("%Y-%m-%d"))
+        ttk.Entry(schedule_frame, textvariable=self.job_date_var, width=12).pack(side='left')
         
         ttk.Button(new_job_frame, text="➕ Create Job", command=self.create_scheduled_job, style='Action.TButton').pack(anchor='w')
         
@@ -639,6 +874,7 @@ class AutoMailerGUI:
         
         columns = ("Name", "Type", "Time", "Status", "Next Run")
         self.jobs_tree = ttk.Treeview(jobs_container, columns=columns, show='headings', height=10)
+        self.jobs_rows = {}  # job id (also the tree item id) -> values shown in its row
         
         for col in columns:
             self.jobs_tree.heading(col, text=col)
@@ -659,11 +895,8 @@ class AutoMailerGUI:
         
         self.refresh_scheduled_jobs()
     
-    def create_settings_tab(self):
+    def create_settings_tab(self, settings_frame):
         """Create settings tab"""
-        settings_frame = ttk.Frame(self.notebook)
-        self.notebook.add(settings_frame, text="⚙️ Settings")
-        
         # Header
         header_frame = ttk.Frame(settings_frame)
         header_frame.pack(fill='x', padx=15, pady=15)
@@ -696,7 +929,7 @@ class AutoMailerGUI:
         left_col.pack(side='left', fill='x', expand=True)
         
         ttk.Label(left_col, text=f"📦 Default Batch Size: {config.DEFAULT_BATCH_SIZE}", style='Subtitle.TLabel').pack(anchor='w', pady=2)
-        ttk.Label(left_col, text=f"⏱️ Default Time Gap: {config.DEFAULT_TIME_GAP} seconds", style='Subtitle.TLabel').pack(anchor='w', pady=2)
+        ttk.Label(left_col, text=f"⏱️ Default Pause Between Batches: {config.DEFAULT_TIME_GAP} seconds", style='Subtitle.TLabel').pack(anchor='w', pady=2)
         ttk.Label(left_col, text="📎 Max Attachment Size: 25MB per email", style='Subtitle.TLabel').pack(anchor='w', pady=2)
         
         # Right column
@@ -744,25 +977,32 @@ class AutoMailerGUI:
         self.update_stats()
     
     def update_stats(self):
-        """Update statistics display"""
+        """Update statistics display (called whenever a counted value changes)"""
+        if self.stats_label is None:
+            return
+        
+        if self.template_count is None:
+            self.template_count = len(list(config.TEMPLATES_DIR.glob('*.json'))) if config.TEMPLATES_DIR.exists() else 0
+        
         try:
-            stats_text = f"📧 Session Emails Sent: {getattr(self.email_sender, 'sent_count', 0)}\n"
-            stats_text += f"❌ Session Failures: {getattr(self.email_sender, 'failed_count', 0)}\n"
-            stats_text += f"📎 Attachments: {len(self.attachment_files)}\n"
-            stats_text += f"📝 Templates: {len(list(config.TEMPLATES_DIR.glob('*.json'))) if config.TEMPLATES_DIR.exists() else 0}"
+            values = (getattr(self.email_sender, 'sent_count', 0), getattr(self.email_sender, 'failed_count', 0),
+                      len(self.attachment_files), self.template_count)
+            # Progress updates call this often; only touch the label when something changed
+            if values == self.stats_values:
+                return
+            self.stats_values = values
+            
+            stats_text = f"📧 Session Emails Sent: {values[0]}\n"
+            stats_text += f"❌ Session Failures: {values[1]}\n"
+            stats_text += f"📎 Attachments: {values[2]}\n"
+            stats_text += f"📝 Templates: {values[3]}"
             
             self.stats_label.config(text=stats_text)
         except Exception as e:
             pass
-        
-        # Schedule next update
-        self.root.after(5000, self.update_stats)
     
-    def create_logs_tab(self):
+    def create_logs_tab(self, logs_frame):
         """Create logs tab"""
-        logs_frame = ttk.Frame(self.notebook)
-        self.notebook.add(logs_frame, text="📋 Logs")
-        
         # Header
         header_frame = ttk.Frame(logs_frame)
         header_frame.pack(fill='x', padx=15, pady=15)
@@ -777,8 +1017,11 @@ class AutoMailerGUI:
         logs_container = ttk.Frame(logs_display_frame)
         logs_container.pack(fill='both', expand=True, pady=(0,15))
         
-        self.logs_text = scrolledtext.ScrolledText(logs_container, height=20, wrap=tk.WORD, font=('Consolas', 9))
+        self.logs_text = scrolledtext.ScrolledText(logs_container, height=20, wrap=tk.WORD, font=('Consolas', 9),
+                                                   state='disabled')  # read-only; unlocked only while updating
         self.logs_text.pack(fill='both', expand=True)
+        self.logs_offset = 0  # bytes of the log file already shown
+        self.logs_inode = None  # identity of the log file the offset refers to
         
         # Log controls
         logs_controls = ttk.Frame(logs_display_frame)
@@ -793,46 +1036,60 @@ class AutoMailerGUI:
         ttk.Checkbutton(logs_controls, text="🔄 Auto-refresh", 
                        variable=self.auto_refresh_var).pack(side='right')
         
-        # Load initial logs
+        # Load initial logs, then refresh whenever something new is logged
         self.refresh_logs()
-        self.auto_refresh_logs()
+        self.log_handler = LogViewerHandler()
+        logging.getLogger().addHandler(self.log_handler)
+        self.root.after(500, self.auto_refresh_logs)
     
     def auto_refresh_logs(self):
-        """Auto-refresh logs if enabled"""
-        if self.auto_refresh_var.get():
-            self.refresh_logs()
+        """Refresh logs if enabled and something was logged since the last check"""
+        if self.log_handler is None:
+            return
         
-        # Schedule next refresh
-        self.root.after(10000, self.auto_refresh_logs)  # Every 10 seconds
+        if self.log_handler.written.is_set():
+            self.log_handler.written.clear()
+            if self.auto_refresh_var.get():
+                self.refresh_logs()
+        self.root.after(500, self.auto_refresh_logs)
     
     # Event handlers and methods
     def authenticate_google(self):
         """Authenticate with Google APIs"""
+        def authenticate():
+            if not self.auth.authenticate():
+                return None
+            user_email = self.auth.get_user_email()
+            
+            # Connect email sender and get aliases
+            self.email_sender.connect()
+            return user_email
+        
+        self.run_in_background(authenticate, self.on_authenticated, "Authentication failed", api=True)
+    
+    def on_authenticated(self, user_email):
+        """Update the UI once authentication has finished"""
         try:
-            if self.auth.authenticate():
+            if user_email:
                 self.authenticated = True
-                user_email = self.auth.get_user_email()
                 
                 # Update UI
                 self.auth_status_label.config(text=f"✅ Authenticated as {user_email}", style='Success.TLabel')
                 self.connection_status.config(text="● Connected", style='Success.TLabel')
                 
-                # Connect email sender and get aliases
-                self.email_sender.connect()
-                
                 # Update signature info
                 if self.email_sender.gmail_signature:
                     self.signature_info_label.config(text="📝 Signature detected", style='Success.TLabel')
                 else:
                     self.signature_info_label.config(text="📝 No signature found", style='Warning.TLabel')
                 
-                # Refresh aliases
-                self.refresh_aliases()
+                # Fill the aliases dropdown from what connect() just fetched
+                self.refresh_aliases(refresh=False)
                 
-                showinfo("Success", f"✅ Successfully authenticated with Google!\n\n"
-                                  f"📧 Email: {user_email}\n"
-                                  f"📝 Signature: {'Found' if self.email_sender.gmail_signature else 'None'}\n"
-                                  f"🔗 Aliases: {len(self.email_sender.gmail_aliases)} verified")
+                self.show_toast(f"✅ Successfully authenticated with Google!\n\n"
+                              f"📧 Email: {user_email}\n"
+                              f"📝 Signature: {'Found' if self.email_sender.gmail_signature else 'None'}\n"
+                              f"🔗 Aliases: {len(self.email_sender.gmail_aliases)} verified")
             else:
                 showerror("Error", "Failed to authenticate with Google")
         except Exception as e:
@@ -849,17 +1106,19 @@ class AutoMailerGUI:
             showerror("Error", "Please enter a Google Sheets URL")
             return
         
-        try:
-            # Get available sheets
-            sheet_names = self.sheets_handler.get_available_sheets(url)
-            if sheet_names:
-                self.sheet_combo['values'] = sheet_names
-                self.sheet_combo.set(sheet_names[0])
-                showinfo("Success", f"✅ Loaded {len(sheet_names)} sheets")
-            else:
-                showerror("Error", "No sheets found or unable to access the spreadsheet")
-        except Exception as e:
-            showerror("Error", f"Failed to load sheets: {str(e)}")
+        # Get available sheets (repeat clicks within SHEETS_CACHE_TTL reuse the last answer)
+        self.run_in_background(lambda: self.cached_call(('sheets', url), config.SHEETS_CACHE_TTL,
+                                                        lambda: self.sheets_handler.get_available_sheets(url)),
+                               self.on_sheets_loaded, "Failed to load sheets", api=True)
+    
+    def on_sheets_loaded(self, sheet_names):
+        """Fill the sheet dropdown with the loaded sheet names"""
+        if sheet_names:
+            self.sheet_combo['values'] = sheet_names
+            self.sheet_combo.set(sheet_names[0])
+            self.show_toast(f"✅ Loaded {len(sheet_names)} sheets")
+        else:
+            showerror("Error", "No sheets found or unable to access the spreadsheet")
     
     def preview_data(self):
         """Preview data from selected sheet"""
@@ -874,39 +1133,137 @@ class AutoMailerGUI:
             showerror("Error", "Please select a sheet to preview")
             return
         
+        self.run_in_background(lambda: self.sheets_handler.get_sheet_data(url, sheet_name),
+                               self.on_sheet_data_loaded, "Failed to preview data", api=True)
+    
+    def on_sheet_data_loaded(self, sheet_data):
+        """Show freshly loaded sheet data in the preview"""
         try:
-            self.current_sheet_data = self.sheets_handler.get_sheet_data(url, sheet_name)
+            self.current_sheet_data = sheet_data
+            
+            # Drop the previous sheet's rows, whatever this load turns out to hold
+            self.clear_preview()
             
             if self.current_sheet_data and 'data' in self.current_sheet_data and self.current_sheet_data['data']:
-                # Clear existing data
-                self.data_tree.delete(*self.data_tree.get_children())
-                
                 # Set up columns
                 columns = self.current_sheet_data['headers']
-                self.data_tree['columns'] = columns
-                self.data_tree['show'] = 'headings'
+                self.data_tree.configure(columns=columns, show='headings')
                 
                 for col in columns:
                     self.data_tree.heading(col, text=col)
                     self.data_tree.column(col, width=120)
                 
-                # Add data (limit to first 100 rows for performance)
-                for row in self.current_sheet_data['data'][:100]:
-                    values = [str(row.get(col, '')) for col in columns]
-                    self.data_tree.insert('', 'end', values=values)
+                # Create just enough rows to fill the view; scrolling refills them
+                row_count = len(self.current_sheet_data['data'])
+                visible_rows = min(int(self.data_tree.cget('height')), row_count)
+                # Rows are keyed by the stripped header names and always carry every column
+                keys = [str(col).strip() for col in columns]
+                self.preview_values = itemgetter(*keys) if len(keys) > 1 else (lambda row: (row[keys[0]],))
+                self.preview_items = [self.data_tree.insert('', 'end') for _ in range(visible_rows)]
+                self.preview_offset = 0
+                self.refresh_preview_rows()
                 
                 # Update status and email count
-                row_count = len(self.current_sheet_data['data'])
                 self.status_label.config(text=f"✅ Loaded {row_count} rows", style='Success.TLabel')
                 self.email_count_label.config(text=f"📧 {row_count} emails ready")
+                self.highlight_placeholders()
                 
-                showinfo("Success", f"✅ Previewing {row_count} rows of data\n\n"
-                                  f"📊 Columns: {', '.join(columns[:3])}{'...' if len(columns) > 3 else ''}")
+                self.show_toast(f"✅ Previewing {row_count} rows of data\n\n"
+                              f"📊 Columns: {', '.join(columns[:3])}{'...' if len(columns) > 3 else ''}")
             else:
                 showerror("Error", "No data found in the selected sheet")
         except Exception as e:
+            self.clear_preview()
             showerror("Error", f"Failed to preview data: {str(e)}")
     
+    def clear_preview(self):
+        """Empty the data preview and cancel any refill still pending for it"""
+        pending = self.pending_after.pop('preview', None)
+        if pending:
+            self.root.after_cancel(pending)
+        
+        self.data_tree.delete(*self.data_tree.get_children())
+        self.preview_items = []
+        self.preview_offset = 0
+        self.email_count_label.config(text="")
+    
+    def refresh_preview_rows(self):
+        """Fill the recycled preview rows with the sheet rows currently in view"""
+        rows = self.current_sheet_data['data']
+        first = self.preview_offset
+        values = self.preview_values
+        # Sheet values are already strings, so each row goes to Tk as a ready-made list,
+        # straight through tk.call without ttk's per-call option formatting
+        call, tree = self.data_tree.tk.call, self.data_tree._w
+        for item, row in zip(self.preview_items, rows[first:first + len(self.preview_items)]):
+            call(tree, 'item', item, '-values', values(row))
+        
+        total = len(rows)
+        self.data_scrollbar_y.set(first / total, (first + len(self.preview_items)) / total)
+    
+    def scroll_preview(self, action, amount, unit=None):
+        """Scrollbar command for the data preview"""
+        if not self.preview_items:
+            return
+        
+        total = len(self.current_sheet_data['data'])
+        visible_rows = len(self.preview_items)
+        if action == 'moveto':
+            first = int(float(amount) * total)
+        else:
+            step = visible_rows if unit == 'pages' else 1
+            first = self.preview_offset + int(amount) * step
+        
+        first = max(0, min(first, total - visible_rows))
+        if first != self.preview_offset:
+            # Move the scrollbar right away but refill the rows at most once per frame while dragging
+            self.preview_offset = first
+            self.data_scrollbar_y.set(first / total, (first + visible_rows) / total)
+            self.debounce('preview', 16, self.refresh_preview_rows)
+    
+    def debounce(self, key, ms, func):
+        """Run func once, ms after the last call made with the same key"""
+        pending = self.pending_after.get(key)
+        if pending:
+            self.root.after_cancel(pending)
+        
+        def run():
+            self.pending_after.pop(key, None)
+            func()
+        
+        self.pending_after[key] = self.root.after(ms, run)
+    
+    def on_preview_wheel(self, event):
+        """Scroll the data preview with the mouse wheel"""
+        direction = -1 if event.num == 4 or event.delta > 0 else 1
+        self.scroll_preview('scroll', direction * 3, 'units')
+        return "break"
+    
+    def on_body_modified(self, event):
+        """Re-check body placeholders shortly after the user stops typing"""
+        self.body_text.edit_modified(False)  # re-arm <<Modified>> for the next edit
+        self.body_cache = None
+        self.debounce('placeholders', 300, self.highlight_placeholders)
+    
+    def get_body(self):
+        """Get the email body, copying it out of the Text widget only after it changed"""
+        # The modified flag is set as soon as the text changes, even before <<Modified>> is handled
+        if self.body_cache is None or self.body_text.edit_modified():
+            self.body_cache = self.body_text.get(1.0, 'end-1c')
+        return self.body_cache
+    
+    def highlight_placeholders(self):
+        """Mark body placeholders that don't match any column of the loaded sheet"""
+        self.body_text.tag_remove('unknown_placeholder', 1.0, tk.END)
+        if not self.current_sheet_data:
+            return
+        
+        columns = self.current_sheet_data['headers']
+        body = self.get_body()
+        for match in PLACEHOLDER_PATTERN.finditer(body):
+            if self.sheets_handler.match_column(match.group(1).strip(), columns) is None:
+                self.body_text.tag_add('unknown_placeholder', f"1.0+{match.start()}c", f"1.0+{match.end()}c")
+    
     def validate_placeholders(self):
         """Validate placeholders in email template with suggestions"""
         if self.current_sheet_data is None:
@@ -914,12 +1271,10 @@ class AutoMailerGUI:
             return
         
         subject = self.subject_var.get()
-        body = self.body_text.get(1.0, tk.END)
-        
-        missing_subject = self.sheets_handler.validate_placeholders(subject, self.current_sheet_data)
-        missing_body = self.sheets_handler.validate_placeholders(body, self.current_sheet_data)
+        body = self.get_body()
         
-        all_missing = list(set(missing_subject + missing_body))
+        # Subject and body are scanned together; find_placeholders already drops duplicates
+        all_missing = self.sheets_handler.validate_placeholders(f"{subject}\n{body}", self.current_sheet_data)
         
         if all_missing:
             # Create detailed validation window
@@ -935,24 +1290,24 @@ class AutoMailerGUI:
             feedback_text = scrolledtext.ScrolledText(validation_window, height=15, wrap=tk.WORD, font=('Segoe UI', 9))
             feedback_text.pack(fill='both', expand=True, padx=15, pady=(0,15))
             
-            feedback_content = "The following placeholders were not found in your data:\n\n"
+            feedback_lines = ["The following placeholders were not found in your data:\n"]
             
             for placeholder in all_missing:
                 suggestions = self.sheets_handler.get_column_suggestions(placeholder, self.current_sheet_data)
-                feedback_content += f"❌ '(({placeholder}))'\n"
+                feedback_lines.append(f"❌ '(({placeholder}))'")
                 if suggestions:
-                    feedback_content += f"   💡 Did you mean: {', '.join(f'(({s}))' for s in suggestions)}\n"
-                feedback_content += "\n"
+                    feedback_lines.append(f"   💡 Did you mean: {', '.join(f'(({s}))' for s in suggestions)}")
+                feedback_lines.append("")
             
-            feedback_content += f"\n📋 Available columns:\n{', '.join(f'(({col}))' for col in self.current_sheet_data['headers'])}"
+            feedback_lines.append(f"\n📋 Available columns:\n{', '.join(f'(({col}))' for col in self.current_sheet_data['headers'])}")
             
-            feedback_text.insert(1.0, feedback_content)
+            feedback_text.insert(1.0, "\n".join(feedback_lines))
             feedback_text.config(state='disabled')
             
             ttk.Button(validation_window, text="Close", command=validation_window.destroy).pack(pady=(0,15))
         else:
-            showinfo("Validation Success", "✅ All placeholders are valid!\n\n"
-                                         f"Found {len(self.sheets_handler.find_placeholders(subject + body))} placeholders")
+            self.show_toast("✅ All placeholders are valid!\n\n"
+                          f"Found {len(self.sheets_handler.find_placeholders(subject + body))} placeholders")
     
     def send_emails(self):
         """Send bulk emails or schedule them"""
@@ -969,7 +1324,7 @@ class AutoMailerGUI:
             return
         
         subject = self.subject_var.get().strip()
-        body = self.body_text.get(1.0, tk.END).strip()
+        body = self.get_body().strip()
         
         if not subject or not body:
             showerror("Error", "Please enter both subject and body")
@@ -987,43 +1342,42 @@ class AutoMailerGUI:
         
         # Check if scheduling is enabled
         if self.schedule_enabled_var.get():
+            schedule_date = self.schedule_date_var.get()
+            schedule_time = self.schedule_time_var.get()
             try:
-                schedule_date = self.schedule_date_var.get()
-                schedule_time = self.schedule_time_var.get()
-                send_datetime = datetime.datetime.strptime(f"{schedule_date} {schedule_time}", "%Y-%m-%d %H:%M")
-                
-                if send_datetime <= datetime.datetime.now():
-                    showerror("Error", "Scheduled time must be in the future")
-                    return
-                
-                # Confirm schedule
-                email_count = len(self.current_sheet_data['data'])
-                attach_info = f" with {len(self.attachment_files)} attachment(s)" if attachments else ""
-                from_info = f" from {from_name} <{from_email}>" if from_email else ""
-                sig_info = " (with signature)" if include_signature else ""
-                
-                if not askyesno("Confirm Schedule", 
-                               f"📅 Schedule {email_count} emails{attach_info}{from_info}{sig_info}\n\n"
-                               f"⏰ Send time: {send_datetime}\n\n"
-                               f"Continue?"):
-                    return
-                
-                # Schedule the email
-                if self.email_sender.send_scheduled_email(
-                    self.current_sheet_data, subject, body, send_datetime,
-                    None, self.batch_size_var.get(), self.time_gap_var.get(),
-                    attachments, from_email, from_name, include_signature
-                ):
-                    showinfo("Scheduled", f"✅ Emails scheduled for {send_datetime}\n\n"
-                                        f"📧 {email_count} emails will be sent automatically")
-                    self.status_label.config(text=f"📅 Scheduled for {send_datetime}", style='Success.TLabel')
-                else:
-                    showerror("Error", "Failed to schedule emails")
-                return
-                
+                send_datetime = parse_schedule_datetime(schedule_date, schedule_time)
             except ValueError:
                 showerror("Error", "Invalid date or time format")
                 return
+            
+            if send_datetime <= datetime.datetime.now():
+                showerror("Error", "Scheduled time must be in the future")
+                return
+            
+            # Confirm schedule
+            email_count = len(self.current_sheet_data['data'])
+            attach_info = f" with {len(self.attachment_files)} attachment(s)" if attachments else ""
+            from_info = f" from {from_name} <{from_email}>" if from_email else ""
+            sig_info = " (with signature)" if include_signature else ""
+            
+            if not askyesno("Confirm Schedule", 
+                           f"📅 Schedule {email_count} emails{attach_info}{from_info}{sig_info}\n\n"
+                           f"⏰ Send time: {send_datetime}\n\n"
+                           f"Continue?"):
+                return
+            
+            # Schedule the email
+            if self.email_sender.send_scheduled_email(
+                self.current_sheet_data, subject, body, send_datetime,
+                None, self.batch_size_var.get(), self.time_gap_var.get(),
+                attachments, from_email, from_name, include_signature
+            ):
+                self.show_toast(f"✅ Emails scheduled for {send_datetime}\n\n"
+                              f"📧 {email_count} emails will be sent automatically")
+                self.status_label.config(text=f"📅 Scheduled for {send_datetime}", style='Success.TLabel')
+            else:
+                showerror("Error", "Failed to schedule emails")
+            return
         
         # Regular send (not scheduled)
         email_count = len(self.current_sheet_data['data'])
@@ -1034,14 +1388,16 @@ class AutoMailerGUI:
         if not askyesno("Confirm Send", 
                        f"🚀 Send {email_count} emails{attach_info}{from_info}{sig_info}?\n\n"
                        f"📦 Batch size: {self.batch_size_var.get()}\n"
-                       f"⏱️ Time gap: {self.time_gap_var.get()} seconds\n\n"
+                       f"⏱️ Pause between batches: {self.time_gap_var.get()} seconds\n\n"
                        f"This will start immediately. Continue?"):
             return
         
         # Start sending in background thread
         self.sending_in_progress = True
+        self.stop_event.clear()
         self.send_button.config(state='disabled', text="⏳ Sending...")
-        self.progress_var.set(0)
+        self.set_api_buttons_state(['disabled'])
+        self.progress_bar.configure(value=0)
         
         def send_worker():
             try:
@@ -1055,7 +1411,8 @@ class AutoMailerGUI:
                     attachments=attachments,
                     from_email=from_email,
                     from_name=from_name,
-                    include_signature=include_signature
+                    include_signature=include_signature,
+                    stop_event=self.stop_event
                 )
                 
                 # Update UI on completion
@@ -1068,25 +1425,46 @@ class AutoMailerGUI:
     
     def update_progress(self, progress, sent, failed):
         """Update progress bar and status"""
-        self.root.after(0, lambda: self._update_progress_ui(progress, sent, failed))
+        # Called once per email from the send threads; the UI picks up the latest value ~30 times a second
+        self.pending_progress = (progress, sent, failed)
+        if not self.progress_flush_scheduled:
+            self.progress_flush_scheduled = True
+            self.root.after(33, self._flush_progress)
+    
+    def _flush_progress(self):
+        """Show the most recent progress update"""
+        self.progress_flush_scheduled = False
+        pending, self.pending_progress = self.pending_progress, None
+        if pending:
+            self._update_progress_ui(*pending)
     
     def _update_progress_ui(self, progress, sent, failed):
         """Update progress UI elements"""
-        self.progress_var.set(progress)
+        self.progress_bar.configure(value=progress)
         self.status_label.config(text=f"🚀 Progress: {progress:.1f}% - Sent: {sent}, Failed: {failed}", style='Info.TLabel')
+        self.update_stats()
     
     def on_send_complete(self, sent, failed):
         """Handle send completion"""
         self.sending_in_progress = False
+        self.pending_progress = None  # a late progress flush must not overwrite the final status
         self.send_button.config(state='normal', text="🚀 Send Emails")
-        self.progress_var.set(100)
-        self.status_label.config(text=f"✅ Completed - Sent: {sent}, Failed: {failed}", style='Success.TLabel')
+        self.set_api_buttons_state(['!disabled'])
+        self.update_stats()
+        
+        if self.stop_event.is_set():
+            self.status_label.config(text=f"⏹️ Stopped - Sent: {sent}, Failed: {failed}", style='Warning.TLabel')
+            headline = "⏹️ Email sending stopped."
+        else:
+            self.progress_bar.configure(value=100)
+            self.status_label.config(text=f"✅ Completed - Sent: {sent}, Failed: {failed}", style='Success.TLabel')
+            headline = "🎉 Email sending completed!"
         
         # Show detailed completion dialog
         total = sent + failed
         success_rate = (sent / total * 100) if total > 0 else 0
         
-        showinfo("Send Complete", f"🎉 Email sending completed!\n\n"
+        showinfo("Send Complete", f"{headline}\n\n"
                                 f"✅ Successfully sent: {sent}\n"
                                 f"❌ Failed: {failed}\n"
                                 f"📊 Success rate: {success_rate:.1f}%\n\n"
@@ -1095,7 +1473,9 @@ class AutoMailerGUI:
     def on_send_error(self, error_msg):
         """Handle send error"""
         self.sending_in_progress = False
+        self.pending_progress = None
         self.send_button.config(state='normal', text="🚀 Send Emails")
+        self.set_api_buttons_state(['!disabled'])
         self.status_label.config(text="❌ Error occurred during sending", style='Error.TLabel')
         showerror("Send Error", f"❌ Error during email sending:\n\n{error_msg}")
     
@@ -1106,7 +1486,7 @@ class AutoMailerGUI:
             return
         
         subject = self.subject_var.get().strip()
-        body = self.body_text.get(1.0, tk.END).strip()
+        body = self.get_body().strip()
         
         if not subject or not body:
             showerror("Error", "Please enter both subject and body")
@@ -1126,10 +1506,10 @@ class AutoMailerGUI:
                 from_info = f" from {from_name} <{from_email}>" if from_email else ""
                 sig_info = " (with signature)" if include_signature else ""
                 
-                showinfo("Test Success", f"✅ Test email sent to {user_email}\n\n"
-                                       f"📧 Subject: [TEST] {subject}\n"
-                                       f"📎 Attachments: {len(self.attachment_files) if attachments else 0}\n"
-                                       f"📝 Signature: {'Included' if include_signature else 'Not included'}")
+                self.show_toast(f"✅ Test email sent to {user_email}\n\n"
+                              f"📧 Subject: [TEST] {subject}\n"
+                              f"📎 Attachments: {len(self.attachment_files) if attachments else 0}\n"
+                              f"📝 Signature: {'Included' if include_signature else 'Not included'}")
             else:
                 showerror("Error", "Failed to send test email")
         except Exception as e:
@@ -1140,14 +1520,14 @@ class AutoMailerGUI:
         if self.sending_in_progress:
             if askyesno("Confirm Stop", "⚠️ Are you sure you want to stop email sending?\n\n"
                                       "This will interrupt the current batch."):
-                self.sending_in_progress = False
+                self.stop_event.set()
                 self.status_label.config(text="⏹️ Stopping email send...", style='Warning.TLabel')
                 self.send_button.config(text="⏹️ Stopping...")
     
     def save_template(self):
         """Save current template"""
         subject = self.subject_var.get().strip()
-        body = self.body_text.get(1.0, tk.END).strip()
+        body = self.get_body().strip()
         
         if not subject or not body:
             showerror("Error", "Please enter both subject and body")
@@ -1169,14 +1549,22 @@ class AutoMailerGUI:
                 
                 # Save to templates directory
                 template_file = config.TEMPLATES_DIR / f"{template_name}.json"
-                with open(template_file, 'w') as f:
-                    import json
-                    json.dump(template_data, f, indent=2)
+                with open(template_file, 'wb') as f:
+                    if orjson:
+                        f.write(orjson.dumps(template_data, option=orjson.OPT_INDENT_2))
+                    else:
+                        f.write(json.dumps(template_data, indent=2).encode('utf-8'))
                 
-                showinfo("Success", f"✅ Template '{template_name}' saved\n\n"
-                                  f"📎 Attachments: {len(self.attachment_files)}\n"
-                                  f"📝 Signature: {'Included' if self.include_signature_var.get() else 'Not included'}")
-                self.refresh_templates()
+                self.show_toast(f"✅ Template '{template_name}' saved\n\n"
+                              f"📎 Attachments: {len(self.attachment_files)}\n"
+                              f"📝 Signature: {'Included' if self.include_signature_var.get() else 'Not included'}")
+                # An unopened templates tab lists the new file when it is built.
+                # Overwriting a template leaves the directory mtime alone, so force a rescan.
+                self.templates_dir_mtime = None
+                if self.templates_listbox is not None:
+                    self.refresh_templates()
+                self.template_count = None
+                self.update_stats()
             except Exception as e:
                 showerror("Error", f"Failed to save template: {str(e)}")
     
@@ -1185,52 +1573,78 @@ class AutoMailerGUI:
         template_file = filedialog.askopenfilename(
             initialdir=config.TEMPLATES_DIR,
             title="Select Template File",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=JSON_FILETYPES
         )
         
         if template_file:
-            try:
-                import json
-                with open(template_file, 'r') as f:
-                    template_data = json.load(f)
-                
-                self.subject_var.set(template_data.get('subject', ''))
-                self.body_text.delete(1.0, tk.END)
-                self.body_text.insert(1.0, template_data.get('body', ''))
-                
-                # Load From email settings
-                self.from_email_var.set(template_data.get('from_email', ''))
-                self.from_name_var.set(template_data.get('from_name', ''))
-                
-                # Load signature setting
-                self.include_signature_var.set(template_data.get('include_signature', True))
-                
-                # Load attachments if they exist
-                saved_attachments = template_data.get('attachments', [])
-                self.clear_attachments()
-                for attachment in saved_attachments:
-                    if os.path.exists(attachment):
-                        self.attachment_files.append(attachment)
-                        self.attachments_listbox.insert(tk.END, f"📎 {os.path.basename(attachment)}")
-                self.update_attachment_info()
-                
-                showinfo("Success", f"✅ Template loaded\n\n"
-                                  f"📎 Attachments: {len(saved_attachments)}\n"
+            def on_loaded(result):
+                try:
+                    template_data = self.apply_template(*result)
+                    self.show_toast(f"✅ Template loaded\n\n"
+                                  f"📎 Attachments: {len(template_data.get('attachments', []))}\n"
                                   f"📝 Signature: {'Included' if template_data.get('include_signature', True) else 'Not included'}")
-            except Exception as e:
-                showerror("Error", f"Failed to load template: {str(e)}")
+                except Exception as e:
+                    showerror("Error", f"Failed to load template: {str(e)}")
+            
+            self.run_in_background(lambda: self.read_template_files(template_file), on_loaded,
+                                   "Failed to load template")
+    
+    def read_template_files(self, template_file):
+        """Read a template and stat its attachments (runs on a worker thread)"""
+        template_data = read_template(template_file)
+        attachment_sizes = {path: self.get_file_size(path) for path in template_data.get('attachments', [])}
+        return template_data, attachment_sizes
+    
+    def apply_template(self, template_data, attachment_sizes):
+        """Fill the main tab from a loaded template"""
+        self.subject_var.set(template_data.get('subject', ''))
+        self.body_text.delete(1.0, tk.END)
+        self.body_text.insert(1.0, template_data.get('body', ''))
+        
+        # Load From email settings
+        self.from_email_var.set(template_data.get('from_email', ''))
+        self.from_name_var.set(template_data.get('from_name', ''))
+        
+        # Load signature setting
+        self.include_signature_var.set(template_data.get('include_signature', True))
+        
+        # Load attachments that still exist
+        self.clear_attachments()
+        new_labels = []
+        for attachment in template_data.get('attachments', []):
+            file_size = None if attachment in self.attachment_sizes else attachment_sizes.get(attachment)
+            if file_size is not None:
+                new_labels.append(self.append_attachment(attachment, file_size))
+        if new_labels:
+            self.attachments_listbox.insert(tk.END, *new_labels)
+        self.update_attachment_info()
+        return template_data
     
     def refresh_templates(self):
         """Refresh templates list"""
-        self.templates_listbox.delete(0, tk.END)
-        
         try:
-            if config.TEMPLATES_DIR.exists():
-                templates = list(config.TEMPLATES_DIR.glob("*.json"))
-                templates.sort(key=lambda x: x.stat().st_mtime, reverse=True)  # Sort by modification time
-                
-                for template_file in templates:
-                    self.templates_listbox.insert(tk.END, f"📝 {template_file.stem}")
+            if not config.TEMPLATES_DIR.exists():
+                self.templates_listbox.delete(0, tk.END)
+                self.templates_dir_mtime = None
+                return
+            
+            # Adding or removing a template bumps the directory mtime; skip the scan otherwise
+            dir_mtime = config.TEMPLATES_DIR.stat().st_mtime_ns
+            if dir_mtime == self.templates_dir_mtime:
+                return
+            
+            # scandir entries carry their stat results, so each file is stat'ed once
+            with os.scandir(config.TEMPLATES_DIR) as entries:
+                templates = [(entry.name[:-5], entry.stat().st_mtime)
+                             for entry in entries if entry.name.endswith('.json') and entry.is_file()]
+            templates.sort(key=lambda item: item[1], reverse=True)  # Sort by modification time
+            self.template_count = len(templates)
+            self.templates_dir_mtime = dir_mtime
+            
+            # One Listbox call for the whole list
+            self.templates_listbox.delete(0, tk.END)
+            if templates:
+                self.templates_listbox.insert(tk.END, *[f"📝 {name}" for name, _ in templates])
         except Exception as e:
             print(f"Error refreshing templates: {e}")
     
@@ -1244,38 +1658,20 @@ class AutoMailerGUI:
         template_name = self.templates_listbox.get(selection[0]).replace("📝 ", "")
         template_file = config.TEMPLATES_DIR / f"{template_name}.json"
         
-        try:
-            import json
-            with open(template_file, 'r') as f:
-                template_data = json.load(f)
-            
-            self.subject_var.set(template_data.get('subject', ''))
-            self.body_text.delete(1.0, tk.END)
-            self.body_text.insert(1.0, template_data.get('body', ''))
-            
-            # Load From email settings
-            self.from_email_var.set(template_data.get('from_email', ''))
-            self.from_name_var.set(template_data.get('from_name', ''))
-            
-            # Load signature setting
-            self.include_signature_var.set(template_data.get('include_signature', True))
-            
-            # Load attachments if they exist
-            saved_attachments = template_data.get('attachments', [])
-            self.clear_attachments()
-            for attachment in saved_attachments:
-                if os.path.exists(attachment):
-                    self.attachment_files.append(attachment)
-                    self.attachments_listbox.insert(tk.END, f"📎 {os.path.basename(attachment)}")
-            self.update_attachment_info()
-            
-            # Switch to main tab
-            self.notebook.select(0)
-            showinfo("Success", f"✅ Template '{template_name}' loaded\n\n"
-                              f"📎 Attachments: {len(saved_attachments)}\n"
+        def on_loaded(result):
+            try:
+                template_data = self.apply_template(*result)
+                
+                # Switch to main tab
+                self.notebook.select(0)
+                self.show_toast(f"✅ Template '{template_name}' loaded\n\n"
+                              f"📎 Attachments: {len(template_data.get('attachments', []))}\n"
                               f"📝 Signature: {'Included' if template_data.get('include_signature', True) else 'Not included'}")
-        except Exception as e:
-            showerror("Error", f"Failed to load template: {str(e)}")
+            except Exception as e:
+                showerror("Error", f"Failed to load template: {str(e)}")
+        
+        self.run_in_background(lambda: self.read_template_files(template_file), on_loaded,
+                               "Failed to load template")
     
     def delete_template(self):
         """Delete selected template"""
@@ -1292,7 +1688,9 @@ class AutoMailerGUI:
                 template_file = config.TEMPLATES_DIR / f"{template_name}.json"
                 template_file.unlink()
                 self.refresh_templates()
-                showinfo("Success", f"✅ Template '{template_name}' deleted")
+                self.template_count = None
+                self.update_stats()
+                self.show_toast(f"✅ Template '{template_name}' deleted")
             except Exception as e:
                 showerror("Error", f"Failed to delete template: {str(e)}")
     
@@ -1310,7 +1708,7 @@ class AutoMailerGUI:
         
         # Get template data
         subject = self.subject_var.get().strip()
-        body = self.body_text.get(1.0, tk.END).strip()
+        body = self.get_body().strip()
         
         if not subject or not body:
             showerror("Error", "Please enter email subject and body in the main tab")
@@ -1326,13 +1724,14 @@ class AutoMailerGUI:
         
         # Prepare schedule time
         schedule_type = self.schedule_type_var.get()
-        schedule_time = self.schedule_time_var.get()
+        schedule_time = self.job_time_var.get()
         
         if schedule_type == "once":
-            schedule_date = self.schedule_date_var.get()
+            schedule_date = self.job_date_var.get()
             try:
-                datetime.datetime.strptime(f"{schedule_date} {schedule_time}", "%Y-%m-%d %H:%M")
-                schedule_time = f"{schedule_date} {schedule_time}"
+                send_datetime = parse_schedule_datetime(schedule_date, schedule_time)
+                # Store the normalized form so the scheduler's fromisoformat always reads it back
+                schedule_time = send_datetime.strftime("%Y-%m-%d %H:%M")
             except ValueError:
                 showerror("Error", "Invalid date or time format")
                 return
@@ -1346,9 +1745,9 @@ class AutoMailerGUI:
             )
             
             if job_id:
-                showinfo("Success", f"✅ Scheduled job '{job_name}' created successfully\n\n"
-                                  f"📅 Type: {schedule_type}\n"
-                                  f"⏰ Time: {schedule_time}")
+                self.show_toast(f"✅ Scheduled job '{job_name}' created successfully\n\n"
+                              f"📅 Type: {schedule_type}\n"
+                              f"⏰ Time: {schedule_time}")
                 self.refresh_scheduled_jobs()
             else:
                 showerror("Error", "Failed to create scheduled job")
@@ -1356,33 +1755,33 @@ class AutoMailerGUI:
             showerror("Error", f"Failed to create scheduled job: {str(e)}")
     
     def refresh_scheduled_jobs(self):
-        """Refresh scheduled jobs list"""
-        # Clear existing items
-        for item in self.jobs_tree.get_children():
-            self.jobs_tree.delete(item)
-        
-        # Add current jobs
+        """Refresh scheduled jobs list, touching only the rows that changed"""
         try:
             jobs = self.scheduler.get_scheduled_jobs()
+            next_runs = self.scheduler.get_next_run_times()
+            rows = {}
             for job in jobs:
-                next_run = self.scheduler.get_next_run_time(job['id'])
+                next_run = next_runs.get(job['id'])
                 next_run_str = next_run.strftime("%Y-%m-%d %H:%M") if next_run else "N/A"
                 
-                # Add status emoji
-                status_emoji = {
-                    'active': '🟢',
-                    'completed': '✅',
-                    'cancelled': '❌',
-                    'failed': '🔴'
-                }.get(job['status'], '⚪')
+                status_emoji = JOB_STATUS_EMOJI.get(job['status'], '⚪')
                 
-                self.jobs_tree.insert('', 'end', values=(
+                rows[job['id']] = (
                     job['name'], 
                     job['schedule_type'].title(), 
                     job['schedule_time'], 
                     f"{status_emoji} {job['status'].title()}", 
                     next_run_str
-                ))
+                )
+            
+            for job_id in self.jobs_rows.keys() - rows.keys():
+                self.jobs_tree.delete(job_id)
+            for job_id, values in rows.items():
+                if job_id not in self.jobs_rows:
+                    self.jobs_tree.insert('', 'end', iid=job_id, values=values)
+                elif values != self.jobs_rows[job_id]:
+                    self.jobs_tree.item(job_id, values=values)
+            self.jobs_rows = rows
         except Exception as e:
             print(f"Error refreshing jobs: {e}")
     
@@ -1393,22 +1792,18 @@ class AutoMailerGUI:
             showerror("Error", "Please select a job to cancel")
             return
         
-        item = self.jobs_tree.item(selection[0])
-        job_name = item['values'][0]
+        # Rows are keyed by job id, so jobs that share a name are told apart
+        job_id = selection[0]
+        job_name = self.jobs_rows[job_id][0]
         
         if askyesno("Confirm Cancel", f"⚠️ Are you sure you want to cancel job '{job_name}'?\n\n"
                                     f"This will stop all future executions."):
             try:
-                # Find job by name and cancel it
-                jobs = self.scheduler.get_scheduled_jobs()
-                for job in jobs:
-                    if job['name'] == job_name:
-                        if self.scheduler.cancel_job(job['id']):
-                            showinfo("Success", f"✅ Job '{job_name}' cancelled")
-                            self.refresh_scheduled_jobs()
-                        else:
-                            showerror("Error", "Failed to cancel job")
-                        break
+                if self.scheduler.cancel_job(job_id):
+                    self.show_toast(f"✅ Job '{job_name}' cancelled")
+                    self.refresh_scheduled_jobs()
+                else:
+                    showerror("Error", "Failed to cancel job")
             except Exception as e:
                 showerror("Error", f"Failed to cancel job: {str(e)}")
     
@@ -1416,36 +1811,75 @@ class AutoMailerGUI:
         """Browse for credentials file"""
         file_path = filedialog.askopenfilename(
             title="Select Google API Credentials File",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=JSON_FILETYPES
         )
         
         if file_path:
             self.creds_path_var.set(file_path)
             # Update config (this is simplified - you might want to save this to a config file)
             config.CREDENTIALS_FILE = file_path
-            showinfo("Success", "✅ Credentials file path updated")
+            self.show_toast("✅ Credentials file path updated")
     
     def open_setup_guide(self):
         """Open Google API setup guide"""
         webbrowser.open("https://developers.google.com/gmail/api/quickstart/python")
     
     def refresh_logs(self):
-        """Refresh logs display"""
-        self.logs_text.delete(1.0, tk.END)
-        
+        """Refresh logs display, appending only what was logged since the last refresh"""
         try:
             log_file = config.LOGS_DIR / 'email_sender.log'
-            if log_file.exists():
-                with open(log_file, 'r') as f:
-                    logs = f.read()
-                    if logs:
-                        self.logs_text.insert(1.0, logs)
-                    else:
-                        self.logs_text.insert(1.0, "📄 No log entries yet.\n\nLogs will appear here when you send emails.")
-            else:
-                self.logs_text.insert(1.0, "📄 Log file not found.\n\nLogs will be created when you send your first email.")
+            if not log_file.exists():
+                self.show_log_message("📄 Log file not found.\n\nLogs will be created when you send your first email.")
+                return
+            
+            with open(log_file, 'rb') as f:
+                stat = os.fstat(f.fileno())
+                size = stat.st_size
+                if size < self.logs_offset or stat.st_ino != self.logs_inode:
+                    # The file was cleared or replaced; start over
+                    self.logs_offset = 0
+                    self.logs_inode = stat.st_ino
+                start = max(self.logs_offset, size - config.LOG_VIEW_MAX_BYTES)
+                f.seek(start)
+                data = f.read(size - start)
+            
+            # Skip a partial first line if we jumped ahead, and leave a partial last line for next time
+            first = data.find(b'\n') + 1 if start > self.logs_offset else 0
+            last = data.rfind(b'\n') + 1
+            if last <= first:
+                if self.logs_offset == 0:
+                    self.show_log_message("📄 No log entries yet.\n\nLogs will appear here when you send emails.")
+                return
+            
+            # Only the newest lines of a large chunk would survive the trim below, so don't insert the rest
+            new_lines = deque(data[first:last].splitlines(keepends=True), maxlen=config.LOG_VIEW_MAX_LINES)
+            new_text = b''.join(new_lines).decode('utf-8', errors='replace')
+            follow = self.logs_text.yview()[1] >= 1.0
+            
+            # All changes happen between these two calls, so Tk redraws the view once
+            self.logs_text.configure(state='normal')
+            if start > self.logs_offset or self.logs_offset == 0:
+                self.logs_text.delete(1.0, tk.END)
+            self.logs_offset = start + last
+            self.logs_text.insert(tk.END, new_text)
+            
+            # Keep only the newest lines in the widget
+            line_count = int(self.logs_text.index('end-1c').split('.')[0])
+            if line_count > config.LOG_VIEW_MAX_LINES:
+                self.logs_text.delete(1.0, f"{line_count - config.LOG_VIEW_MAX_LINES + 1}.0")
+            self.logs_text.configure(state='disabled')
+            if follow:
+                self.logs_text.see(tk.END)
         except Exception as e:
-            self.logs_text.insert(1.0, f"❌ Error reading logs: {e}")
+            self.show_log_message(f"❌ Error reading logs: {e}")
+    
+    def show_log_message(self, message):
+        """Replace the log view with a status message"""
+        self.logs_offset = 0
+        self.logs_text.configure(state='normal')
+        self.logs_text.delete(1.0, tk.END)
+        self.logs_text.insert(1.0, message)
+        self.logs_text.configure(state='disabled')
     
     def clear_logs(self):
         """Clear log files"""
@@ -1455,9 +1889,8 @@ class AutoMailerGUI:
                 log_file = config.LOGS_DIR / 'email_sender.log'
                 if log_file.exists():
                     log_file.unlink()
-                self.logs_text.delete(1.0, tk.END)
-                self.logs_text.insert(1.0, "📄 Logs cleared.\n\nNew logs will appear here when you send emails.")
-                showinfo("Success", "✅ Logs cleared")
+                self.show_log_message("📄 Logs cleared.\n\nNew logs will appear here when you send emails.")
+                self.show_toast("✅ Logs cleared")
             except Exception as e:
                 showerror("Error", f"Failed to clear logs: {str(e)}")
     
@@ -1466,18 +1899,25 @@ class AutoMailerGUI:
         try:
             file_path = filedialog.asksaveasfilename(
                 defaultextension=".txt",
-                filetypes=[("Text files", "*.txt"), ("All files", "*.*")],
+                filetypes=TEXT_FILETYPES,
                 title="Export Logs"
             )
             
             if file_path:
-                log_content = self.logs_text.get(1.0, tk.END)
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(f"AutoMailer Pro v{config.APP_VERSION} - Log Export\n")
-                    f.write(f"Exported: {datetime.datetime.now().isoformat()}\n")
-                    f.write("=" * 50 + "\n\n")
-                    f.write(log_content)
-                showinfo("Success", f"✅ Logs exported to {file_path}")
+                # The viewer only holds the tail, so export the whole log file
+                log_file = config.LOGS_DIR / 'email_sender.log'
+                header = (f"AutoMailer Pro v{config.APP_VERSION} - Log Export\n"
+                          f"Exported: {datetime.datetime.now().isoformat()}\n"
+                          + "=" * 50 + "\n\n")
+                with open(file_path, 'wb') as f:
+                    f.write(header.encode('utf-8'))
+                    if log_file.exists():
+                        # Copy the log in chunks instead of decoding it into one string
+                        with open(log_file, 'rb') as src:
+                            shutil.copyfileobj(src, f, 1024 * 1024)
+                    else:
+                        f.write(self.logs_text.get(1.0, tk.END).encode('utf-8'))
+                self.show_toast(f"✅ Logs exported to {file_path}")
         except Exception as e:
             showerror("Error", f"Failed to export logs: {str(e)}")
     
@@ -1487,8 +1927,11 @@ class AutoMailerGUI:
             if not askyesno("Confirm Exit", "⚠️ Email sending is in progress. Exit anyway?\n\n"
                                          "This will interrupt the current batch."):
                 return
+            self.stop_event.set()
         
-        # Stop scheduler
+        # Stop log viewer notifications and the scheduler
+        if self.log_handler:
+            logging.getLogger().removeHandler(self.log_handler)
         self.scheduler.stop_scheduler()
         self.root.destroy()
     
@@ -48,8 +48,11 @@ class EmailScheduler:
                     'status': job['status']
                 })
             
-            with open(self.jobs_file, 'w') as f:
+            # Write a sibling file and swap it in, so an interrupted save never truncates the job list
+            tmp_file = f"{self.jobs_file}.tmp"
+            with open(tmp_file, 'w') as f:
                 json.dump(jobs_data, f, indent=2)
+            os.replace(tmp_file, self.jobs_file)
         except Exception as e:
             print(f"Error saving jobs: {e}")
     
@@ -196,10 +199,17 @@ class EmailScheduler:
     
     def get_next_run_time(self, job_id):
         """Get next run time for a job"""
-        try:
-            jobs = schedule.get_jobs(job_id)
-            if jobs:
-                return jobs[0].next_run
-        except:
-            pass
-        return None 
\ No newline at end of file
+        jobs = schedule.get_jobs(job_id)
+        if jobs:
+            return jobs[0].next_run
+        return None
+    
+    def get_next_run_times(self):
+        """Get next run time for every scheduled job, keyed by job id"""
+        # One pass over the schedule instead of a get_jobs(tag) scan per job
+        next_runs = {}
+        for job in schedule.get_jobs():
+            for tag in job.tags:
+                if tag not in next_runs or job.next_run < next_runs[tag]:
+                    next_runs[tag] = job.next_run
+        return next_runs 
\ No newline at end of file
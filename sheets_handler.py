@@ -1,7 +1,39 @@
 import re
+from functools import lru_cache
 from googleapiclient.discovery import build
 from google_auth import GoogleAuthenticator
 
+# Placeholders look like ((column name))
+PLACEHOLDER_PATTERN = re.compile(r'\(\(([^)]+)\)\)')
+
+# Ways a spreadsheet ID can appear in user input, tried in order
+SHEET_ID_PATTERNS = [
+    re.compile(r'/spreadsheets/d/([a-zA-Z0-9-_]+)'),
+    re.compile(r'key=([a-zA-Z0-9-_]+)'),
+    re.compile(r'^([a-zA-Z0-9-_]+)$')  # Direct ID
+]
+
+# A full spreadsheet URL, e.g. one buried in pasted clipboard text
+SHEET_URL_PATTERN = re.compile(r'https?://docs\.google\.com/spreadsheets/d/[a-zA-Z0-9-_]+')
+
+@lru_cache(maxsize=512)
+def suggest_columns(placeholder, headers):
+    """Up to 5 headers sharing a word (or part of one) with the placeholder; headers is a tuple"""
+    placeholder_words = placeholder.lower().split()
+    suggestions = []
+    
+    for header in headers:
+        # Check if placeholder words are in header or vice versa
+        header_words = header.lower().split()
+        if header not in suggestions and any(p_word in h_word or h_word in p_word
+                                             for p_word in placeholder_words
+                                             for h_word in header_words):
+            suggestions.append(header)
+            if len(suggestions) == 5:
+                break
+    
+    return tuple(suggestions)
+
 class SheetsHandler:
     def __init__(self):
         self.auth = GoogleAuthenticator()
@@ -19,14 +51,8 @@ class SheetsHandler:
     
     def extract_sheet_id(self, url):
         """Extract sheet ID from Google Sheets URL"""
-        patterns = [
-            r'/spreadsheets/d/([a-zA-Z0-9-_]+)',
-            r'key=([a-zA-Z0-9-_]+)',
-            r'^([a-zA-Z0-9-_]+)$'  # Direct ID
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, url)
+        for pattern in SHEET_ID_PATTERNS:
+            match = pattern.search(url)
             if match:
                 return match.group(1)
         
@@ -73,19 +99,15 @@ class SheetsHandler:
             
             # Convert to list of dictionaries (like DataFrame records)
             headers = values[0]  # First row as headers
+            # Clean header names once; every row is keyed by the cleaned names
+            clean_headers = [str(header).strip() for header in headers]
+            padding = [''] * len(headers)
             data = []
             for row in values[1:]:
                 # Pad row with empty strings if it's shorter than headers
-                while len(row) < len(headers):
-                    row.append('')
-                
-                row_dict = {}
-                for i, header in enumerate(headers):
-                    # Clean header names and store both original and cleaned versions
-                    clean_header = str(header).strip()
-                    value = str(row[i]).strip() if i < len(row) and row[i] else ''
-                    row_dict[clean_header] = value
-                data.append(row_dict)
+                if len(row) < len(headers):
+                    row = row + padding[len(row):]
+                data.append(dict(zip(clean_headers, [str(value).strip() if value else '' for value in row])))
             
             return {
                 'headers': headers,
@@ -124,16 +146,61 @@ class SheetsHandler:
             if not text or not isinstance(text, str):
                 return []
             
-            # More robust regex to handle spaces and special characters
-            pattern = r'\(\(([^)]+)\)\)'
-            placeholders = re.findall(pattern, text)
+            placeholders = PLACEHOLDER_PATTERN.findall(text)
             # Clean up placeholder names (strip spaces)
             cleaned_placeholders = [p.strip() for p in placeholders]
-            return list(set(cleaned_placeholders))  # Remove duplicates
+            return list(dict.fromkeys(cleaned_placeholders))  # Remove duplicates, keeping template order
         except Exception as e:
             print(f"Error finding placeholders: {e}")
             return []
     
+    def match_column(self, placeholder, columns):
+        """Find the column a placeholder refers to (exact, case-insensitive, then partial match)"""
+        if placeholder in columns:
+            return placeholder
+        
+        placeholder_lower = placeholder.lower().strip()
+        for col in columns:
+            if col.lower().strip() == placeholder_lower:
+                return col
+        
+        # Try partial match (for cases like "company name" matching "Company")
+        for col in columns:
+            col_lower = col.lower().strip()
+            if placeholder_lower in col_lower or col_lower in placeholder_lower:
+                return col
+        
+        return None
+    
+    def compile_template(self, template, columns):
+        """Compile a template into a str.format pattern and the columns that fill its fields
+        
+        Placeholders without a matching column are baked into the pattern as [placeholder].
+        """
+        pieces = PLACEHOLDER_PATTERN.split(template or "")
+        columns = list(columns)
+        pattern = []
+        slots = []
+        for i, piece in enumerate(pieces):
+            if i % 2 == 0:
+                pattern.append(piece.replace('{', '{{').replace('}', '}}'))
+                continue
+            
+            placeholder = piece.strip()
+            column = self.match_column(placeholder, columns)
+            if column is None:
+                # Show missing placeholder
+                pattern.append(f"[{placeholder}]".replace('{', '{{').replace('}', '}}'))
+            else:
+                pattern.append(f"{{{len(slots)}}}")
+                slots.append(column)
+        return ''.join(pattern), slots
+    
+    def render_template(self, compiled, row_data):
+        """Render a compiled template against a single row"""
+        pattern, slots = compiled
+        return pattern.format(*[row_data.get(column) or "" for column in slots])
+    
     def replace_placeholders(self, template, row_data):
         """Replace placeholders with actual data from row"""
         try:
@@ -143,45 +210,8 @@ class SheetsHandler:
             if not row_data or not isinstance(row_data, dict):
                 return template
             
-            result = template
-            
-            # Find all placeholders
-            placeholders = self.find_placeholders(template)
-            
-            for placeholder in placeholders:
-                replacement_value = ""
-                placeholder_found = False
-                
-                # Try exact match first
-                if placeholder in row_data:
-                    replacement_value = str(row_data[placeholder]) if row_data[placeholder] else ""
-                    placeholder_found = True
-                else:
-                    # Try case-insensitive match
-                    placeholder_lower = placeholder.lower().strip()
-                    for col in row_data.keys():
-                        col_lower = col.lower().strip()
-                        if col_lower == placeholder_lower:
-                            replacement_value = str(row_data[col]) if row_data[col] else ""
-                            placeholder_found = True
-                            break
-                    
-                    # Try partial match (for cases like "company name" matching "Company")
-                    if not placeholder_found:
-                        for col in row_data.keys():
-                            col_lower = col.lower().strip()
-                            if placeholder_lower in col_lower or col_lower in placeholder_lower:
-                                replacement_value = str(row_data[col]) if row_data[col] else ""
-                                placeholder_found = True
-                                break
-                
-                if not placeholder_found:
-                    replacement_value = f"[{placeholder}]"  # Show missing placeholder
-                
-                # Replace placeholder with value
-                result = result.replace(f"(({placeholder}))", replacement_value)
-            
-            return result
+            compiled = self.compile_template(template, row_data.keys())
+            return self.render_template(compiled, row_data)
             
         except Exception as e:
             print(f"Error replacing placeholders: {e}")
@@ -230,23 +260,9 @@ class SheetsHandler:
             if not sheet_data or 'headers' not in sheet_data:
                 return []
             
-            headers = [str(h).strip() for h in sheet_data['headers']]
-            placeholder_lower = placeholder.lower().strip()
-            suggestions = []
-            
-            for header in headers:
-                header_lower = header.lower().strip()
-                # Check if placeholder words are in header or vice versa
-                placeholder_words = placeholder_lower.split()
-                header_words = header_lower.split()
-                
-                for p_word in placeholder_words:
-                    for h_word in header_words:
-                        if p_word in h_word or h_word in p_word:
-                            if header not in suggestions:
-                                suggestions.append(header)
-            
-            return suggestions[:5]  # Return top 5 suggestions
+            # Suggestions are cached per (placeholder, headers), so re-validating is a lookup
+            headers = tuple(str(h).strip() for h in sheet_data['headers'])
+            return list(suggest_columns(placeholder.strip(), headers))
         except Exception as e:
             print(f"Error getting column suggestions: {e}")
             return [] 
\ No newline at end of file